@@ -0,0 +1,3 @@
+### BIP39 seed phrase tools
+### the modules are imported on demand (e.g. from bip39.checksum import checksum_idx), nothing is loaded here so that
+### starting one tool does not pay for the wordlists / numpy / process pools of the others
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### Batch seed phrase generation on top of bip39.cn2en_v3
+###
+### generate_seedphrases() takes an iterable of (cn_input, passcode_str) pairs and lazily yields one compact result per
+### pair: (effective chinese input, tuple of the english word indexes including the checksum word). The wordlist and
+### checksum tables are shared across the whole batch, nothing is printed, and no per record dicts / sets are built.
+### The words are the same as generate_seedphrase() gives for the same input. Each distinct passcode is hashed and
+### converted once per batch (PasscodeCache), and the cache counts how much of that work was saved.
+###
+### generate_seedphrases_numpy() gives the same results with the combine and checksum steps run on (chunk, L) uint16 matrices
+### (bip39.vectorized, needs numpy).
+###
+### generate_seedphrases_parallel() gives the same results in the same order from a process pool: every worker loads the
+### tables and starts one PasscodeCache for all its chunks (pool initializer), records are sent in chunks, and finished
+### chunks wait in a reorder buffer until all the chunks before them are out. The number of chunks in flight is bounded,
+### so memory stays flat for any input size.
+### The pool itself is imap_chunks_ordered(), which other batch drivers (bip39.validate) reuse with their own chunk function.
+###
+### File driver - streams one record per line in and out, in input order, the format is picked by the file extension:
+###   python bip39_batch.py input.jsonl [output.jsonl, default/- stdout] [seed length 12/15/18/21/24, default 24] [combining mode 0/1, default 1] [processes, default 1, 0 for all cores] [BIP39 seed 0/1, default 0]
+###   input  .jsonl : {"cn_input": "...", "passcode": "..."}     .csv : header cn_input,passcode
+###   output        : cn_input, cn_effective, passphrase (+ seed: the 64 byte BIP39 seed in hex, see bip39.seed)
+
+import os
+import sys
+import csv
+import json
+import itertools
+import contextlib
+
+from .wordlist import CN_LIST, EN_LIST, get_wordlist, repeat_codes
+from .checksum import seed_params, checksum_idx
+from .cn2en_v3 import passcode_to_base_2048, combine_idxs
+
+def effective_cn_idxs(cn_input, effective_code_length):
+    cn_codes = cn_input.translate(CN_LIST.char_codes)   ### one pass, the excluded characters are not needed here
+    return code_idxs(cn_codes, effective_code_length)
+
+def code_idxs(cn_codes, effective_code_length):
+    return list(map(ord, repeat_codes(cn_codes, effective_code_length)))   ### same repeat / first char logic as generate_seedphrase
+
+### passcode derivation hoisted out of the records - bulk jobs often pair one passcode with thousands of inputs
+class PasscodeCache(dict):
+    ### passcode -> (base2048 digits, hash value), derived on the first record using it. The digits are kept in one order,
+    ### most significant first, so one cache serves both generators: the numpy matrices take them as they are,
+    ### generate_seedphrases reverses them like passcode_to_base_2048(passcode, True)
+    ### records / derived: records with a passcode / sha256 + base2048 conversions done for them, the rest was saved
+    ### maxsize bounds the memory for batches of mostly distinct passcodes: the cache starts over when it is full, 0 turns
+    ### the cache off (every record derives its passcode, as before)
+    NO_PASSCODE = ((0,) * 24, 0)
+
+    def __init__(self, maxsize=1 << 16):
+        super().__init__()
+        self.maxsize = maxsize
+        self.records = self.derived = 0
+
+    def __missing__(self, passcode_str):
+        if len(self) >= self.maxsize:
+            self.clear()
+        self.derived += 1
+        digits, passcode_hash_value = passcode_to_base_2048(passcode_str, False)
+        value = tuple(digits), passcode_hash_value   ### tuple - one value is shared by many records
+        if self.maxsize:
+            self[passcode_str] = value
+        return value
+
+    def derive(self, passcode_str):
+        if not passcode_str:
+            return self.NO_PASSCODE
+        self.records += 1
+        return self[passcode_str]
+
+    def report(self):
+        saved = self.records - self.derived
+        return f"passcodes: {self.records} records with a passcode, {self.derived} derived, {saved} reused ({saved / (self.records or 1):.1%} of the hashing saved)"
+
+def generate_seedphrases(records, effective_code_length=23, bit_wise_add=1, passcodes=None):
+    ### passcodes: a PasscodeCache to share / read the counts of, a new one per call by default
+    cn_codes = CN_LIST.char_codes
+    yield from generate_seedphrases_codes(((cn_input.translate(cn_codes), passcode_str) for cn_input, passcode_str in records), effective_code_length, bit_wise_add, passcodes)
+
+def generate_seedphrases_codes(records, effective_code_length=23, bit_wise_add=1, passcodes=None):
+    ### same as generate_seedphrases, for inputs already translated to wordlist codes (cn_input.translate(CN_LIST.char_codes)),
+    ### e.g. by a caller that needed the codes first (bip39.corpus skips the sentences without any)
+    passcodes = PasscodeCache() if passcodes is None else passcodes
+    for cn_codes, passcode_str in records:
+        cn_idxs = code_idxs(cn_codes, effective_code_length)
+
+        passcode, passcode_hash_value = passcodes.derive(passcode_str)
+        passcode = passcode[::-1]   ### smallest digit first, as generate_seedphrase pairs them with the characters
+
+        en_idxs = combine_idxs(effective_code_length, cn_idxs, passcode, passcode_hash_value, bit_wise_add)
+        en_idxs.append(checksum_idx(en_idxs))
+        yield ''.join(CN_LIST[i] for i in cn_idxs), tuple(en_idxs)
+
+### numpy path - same results, the combine and checksum steps run on (chunksize, L) uint16 matrices (see bip39.vectorized)
+def generate_seedphrases_numpy(records, effective_code_length=23, bit_wise_add=1, chunksize=65536, passcodes=None):
+    import numpy as np
+    from .vectorized import combine_idxs_array, checksum_idxs_array
+
+    passcodes = PasscodeCache() if passcodes is None else passcodes
+    for chunk in _chunked(records, chunksize):
+        cn_rows = [effective_cn_idxs(cn_input, effective_code_length) for cn_input, _ in chunk]
+        passcode_rows = [passcodes.derive(passcode_str)[0] for _, passcode_str in chunk]
+
+        en_idxs = combine_idxs_array(np.array(cn_rows, dtype=np.uint16).reshape(len(chunk), effective_code_length), np.array(passcode_rows, dtype=np.uint16), bit_wise_add)
+        en_idxs = np.column_stack((en_idxs, checksum_idxs_array(en_idxs)))
+        for cn_idxs, en_row in zip(cn_rows, en_idxs.tolist()):
+            yield ''.join(CN_LIST[i] for i in cn_idxs), tuple(en_row)
+
+### process pool
+_worker_passcodes = None   ### the PasscodeCache of a worker process, kept across all the chunks it runs
+
+def _init_worker():
+    ### warm worker: load and index the wordlists once per process, not per chunk - including the translate table of the
+    ### chinese characters, it is built lazily on first use
+    global _worker_passcodes
+    get_wordlist('CHINESE_SIMPLIFIED').char_codes
+    get_wordlist('ENGLISH')
+    _worker_passcodes = PasscodeCache()
+
+def _seedphrases_chunk(chunk, effective_code_length, bit_wise_add):
+    ### one chunk in a worker, with the worker's passcode cache: the results go back with the counts of this chunk, as
+    ### the single item of the chunk (imap_chunks_ordered flattens the items of every chunk)
+    records, derived = _worker_passcodes.records, _worker_passcodes.derived
+    results = list(generate_seedphrases(chunk, effective_code_length, bit_wise_add, _worker_passcodes))
+    return [(results, _worker_passcodes.records - records, _worker_passcodes.derived - derived)]
+
+def _run_chunk(chunk_no, func, chunk, args):
+    return chunk_no, list(func(chunk, *args))
+
+def _chunked(records, chunksize):
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def imap_chunks_ordered(func, records, args=(), processes=None, chunksize=512, initializer=None, initargs=(), executor=None):
+    ### func(chunk, *args) -> results of one chunk of records (module level, so workers can unpickle it)
+    ### yields the results of every chunk in input order, with at most processes * 4 chunks running or buffered
+    ### executor: ProcessPoolExecutor by default, ThreadPoolExecutor for work that releases the GIL (e.g. pbkdf2)
+    import concurrent.futures   ### pulls in logging etc., only imported when a pool is used
+    executor = executor or concurrent.futures.ProcessPoolExecutor
+    processes = processes or os.cpu_count() or 1
+    max_chunks = processes * 4   ### chunks running + waiting in the reorder buffer
+    chunks = enumerate(_chunked(records, chunksize))
+
+    with executor(processes, initializer=initializer, initargs=initargs) as pool:
+        running, reorder_buffer, next_chunk_no = set(), {}, 0
+        while True:
+            for chunk_no, chunk in itertools.islice(chunks, max(0, max_chunks - len(running) - len(reorder_buffer))):
+                running.add(pool.submit(_run_chunk, chunk_no, func, chunk, args))
+            if not running:
+                break
+
+            done, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                chunk_no, results = future.result()
+                reorder_buffer[chunk_no] = results
+
+            while next_chunk_no in reorder_buffer:
+                yield from reorder_buffer.pop(next_chunk_no)
+                next_chunk_no += 1
+
+def generate_seedphrases_parallel(records, effective_code_length=23, bit_wise_add=1, processes=None, chunksize=512, passcodes=None):
+    ### passcodes: a PasscodeCache the counts of the worker caches are added to (every worker derives each passcode once
+    ### for all its chunks), a new one per call by default
+    passcodes = PasscodeCache() if passcodes is None else passcodes
+    for results, records_count, derived in imap_chunks_ordered(_seedphrases_chunk, records, (effective_code_length, bit_wise_add), processes, chunksize, _init_worker):
+        passcodes.records += records_count
+        passcodes.derived += derived
+        yield from results
+
+### file driver helpers
+def read_records(f, fmt):
+    if fmt == 'csv':
+        for row in csv.DictReader(f):
+            yield row['cn_input'], (row.get('passcode') or '').strip()
+    else:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record['cn_input'], (record.get('passcode') or '').strip()
+
+def main_batch(in_path, out_path='', seed_length=24, bit_wise_add=1, processes=1, derive_seed=False):
+    seed_params(seed_length)   ### reject a non standard length before reading any input
+    fmt = 'csv' if in_path.lower().endswith('.csv') else 'jsonl'
+    with open(in_path, 'r', encoding='utf-8', newline='') as fin, (open(out_path, 'w', encoding='utf-8', newline='') if out_path not in ('', '-') else contextlib.nullcontext(sys.stdout)) as fout:
+        records_in, records_out = itertools.tee(read_records(fin, fmt))
+        fields = ['cn_input', 'cn_effective', 'passphrase'] + (['seed'] if derive_seed else [])
+        writer = csv.writer(fout) if fmt == 'csv' else None
+        if writer:
+            writer.writerow(fields)
+
+        passcodes = PasscodeCache()
+        if processes == 1:
+            results = generate_seedphrases(records_in, seed_length - 1, bit_wise_add, passcodes)
+        else:   ### a cache per worker, the counts come back with the chunks
+            results = generate_seedphrases_parallel(records_in, seed_length - 1, bit_wise_add, processes or None, passcodes=passcodes)
+
+        rows = ((cn_input, cn_effective, ' '.join(EN_LIST[i] for i in en_idxs)) for (cn_input, _), (cn_effective, en_idxs) in zip(records_out, results))
+        if derive_seed:   ### BIP39 seed of each passphrase (no BIP39 passphrase), on a thread pool - see bip39.seed
+            from .seed import derive_seeds
+            rows, rows_to_derive = itertools.tee(rows)
+            seeds = derive_seeds((passphrase for _, _, passphrase in rows_to_derive), workers=processes or None)
+            rows = (row + (seed.hex(),) for row, seed in zip(rows, seeds))
+
+        for row in rows:
+            if writer:
+                writer.writerow(row)
+            else:
+                fout.write(json.dumps(dict(zip(fields, row)), ensure_ascii=False) + '\n')
+
+    print(passcodes.report(), file=sys.stderr)   ### stderr - the output may be stdout
+
+def main():
+    args = (sys.argv[1:] + ['', '', '', '', '', ''])[:6]
+    in_path, out_path, seed_length, bit_wise_add, processes, derive_seed = args
+    if not in_path:
+        print(f"Usage: {sys.argv[0]} input.jsonl|input.csv [output|-] [seed length 12/15/18/21/24, default 24] [combining mode 0/1, default 1] [processes, default 1, 0 for all cores] [BIP39 seed 0/1, default 0]")
+        sys.exit(1)
+    main_batch(in_path, out_path, int(seed_length) if seed_length else 24, int(bit_wise_add) if bit_wise_add else 1, int(processes) if processes else 1, bool(int(derive_seed)) if derive_seed else False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### Micro benchmarks for the shared BIP39 helpers
+###
+### Usage:
+###   python bip39_benchmark.py              -> run every benchmark
+###   python bip39_benchmark.py index ...    -> run the named benchmark(s) only
+
+import os
+import sys
+import time
+import random
+import timeit
+
+from .wordlist import CN_LIST
+
+def timed(func, number):
+    ### best of 5 runs, in micro seconds per call
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+### word -> index for one 23 word phrase, taken from the start / middle / end of the list
+### list.index() grows with the position of the word, Wordlist.index() should not
+def bench_index(number=2000):
+    cn_list = list(CN_LIST)   ### plain list - the linear scan used before
+    for position, phrase in (('first', CN_LIST[:23]), ('middle', CN_LIST[1012:1035]), ('last', CN_LIST[-23:])):
+        scan  = timed(lambda: [cn_list.index(c) for c in phrase], number)
+        table = timed(lambda: [CN_LIST.index(c) for c in phrase], number)
+        print(f"{position:>6} 23 words: list.index {scan:8.2f} us/phrase, Wordlist.index {table:6.2f} us/phrase")
+
+def random_records(count, seed=0):
+    rnd = random.Random(seed)
+    return [(''.join(rnd.choices(CN_LIST, k=30)), str(rnd.random())) for _ in range(count)]
+
+### bip39.batch serial vs. process pool throughput, records/s
+def bench_batch(count=20000):
+    from .batch import generate_seedphrases, generate_seedphrases_parallel
+    records = random_records(count)
+
+    start = time.perf_counter()
+    serial = list(generate_seedphrases(records))
+    elapsed = time.perf_counter() - start
+    print(f"  serial       : {count / elapsed:10.0f} records/s")
+
+    for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        parallel = list(generate_seedphrases_parallel(records, processes=processes))
+        elapsed = time.perf_counter() - start
+        assert parallel == serial
+        print(f"  {processes:3d} processes: {count / elapsed:10.0f} records/s")
+
+### bip39.radix2048 codec vs. the recursive lambdas it replaced, for a 256 bit hash and longer inputs
+def bench_radix(number=2000):
+    from .radix2048 import to2048, from2048
+    old_to2048 = lambda n: ([] if n == 0 else old_to2048(n // 2048) + [n % 2048]) if n else []
+    old_from2048 = lambda s: sum(c * (2048 ** i) for i, c in enumerate(reversed(s)))
+
+    rnd = random.Random(0)
+    for ndigits in (24, 230, 900, 5000):
+        calls = max(1, number * 24 // ndigits)
+        digits = [rnd.randrange(2048) for _ in range(ndigits)]
+        value = from2048(digits)
+        assert to2048(value) == digits[next((i for i, d in enumerate(digits) if d), ndigits):]
+        try:
+            old_to = f"{timed(lambda: old_to2048(value), calls):8.1f} us"
+        except RecursionError:
+            old_to = "RecursionError"
+        old_from = timed(lambda: old_from2048(digits), calls)
+        new_to = timed(lambda: to2048(value), calls)
+        new_from = timed(lambda: from2048(digits), calls)
+        print(f"{ndigits:5d} digits: to2048 lambda {old_to:>14}, codec {new_to:6.1f} us | from2048 lambda {old_from:8.1f} us, codec {new_from:6.1f} us")
+
+### bip39.semaj_v2 entropy -> word indexes: the old bit string pipeline vs. the integer one, seeds/s
+def bench_entropy(count=20000):
+    import hashlib
+    from .semaj_v2 import ient2idxs
+    int2bin   = lambda i, n: bin(i)[2:].zfill(n)
+    hex2bin   = lambda h, n: bin(int(h, 16))[2:].zfill(n)
+    bits2idxs = lambda bits: [int(bits[i:i+11], 2) for i in range(0, len(bits), 11)]
+    checksum  = lambda i, n: hex2bin(hashlib.sha256((i%2**n).to_bytes(n//8, 'big')).hexdigest(), n)[:n//32]
+    old_ient2idxs = lambda i, n: bits2idxs(int2bin(i%2**n,n)+checksum(i%2**n,n))
+
+    rnd = random.Random(0)
+    for n in (128, 256):
+        values = [rnd.getrandbits(n) for _ in range(count)]
+        assert [old_ient2idxs(i, n) for i in values] == [ient2idxs(i, n) for i in values]
+        old = timed(lambda: [old_ient2idxs(i, n) for i in values], 1) / count
+        new = timed(lambda: [ient2idxs(i, n) for i in values], 1) / count
+        print(f"  {n} bits: bit strings {1e6 / old:9.0f} seeds/s, integers {1e6 / new:9.0f} seeds/s")
+
+### v3 combine step for a batch: combine_idxs() per phrase vs. combine_idxs_array() on the (N, 23) uint16 matrices
+def bench_combine(count=100000):
+    import numpy as np
+    from .radix2048 import from2048
+    from .cn2en_v3 import combine_idxs
+    from .vectorized import combine_idxs_array
+
+    rnd = np.random.default_rng(0)
+    cn_idxs = rnd.integers(0, 2048, (count, 23), dtype=np.uint16)
+    passcode_digits = rnd.integers(0, 2048, (count, 24), dtype=np.uint16)
+    cn_rows, passcode_rows = cn_idxs.tolist(), passcode_digits.tolist()
+    passcode_values = [from2048(row) for row in passcode_rows]
+
+    for bit_wise_add in (1, 0):
+        loop = timed(lambda: [combine_idxs(23, cn, passcode[::-1], value, bit_wise_add) for cn, passcode, value in zip(cn_rows, passcode_rows, passcode_values)], 1)
+        vectorized = timed(lambda: combine_idxs_array(cn_idxs, passcode_digits, bit_wise_add), 1)
+        assert combine_idxs_array(cn_idxs, passcode_digits, bit_wise_add).tolist() == [combine_idxs(23, cn, passcode[::-1], value, bit_wise_add) for cn, passcode, value in zip(cn_rows, passcode_rows, passcode_values)]
+        print(f"  {count} phrases, mode {bit_wise_add}: combine_idxs {loop / 1000:8.1f} ms, combine_idxs_array {vectorized / 1000:6.1f} ms")
+
+### 32 byte entropy <-> 24 word indexes for a batch: to2048 per phrase vs. the byte window codec, checksums given
+def bench_codec(count=100000):
+    import numpy as np
+    from .radix2048 import to2048, from2048
+    from .vectorized import entropy2idxs_array, idxs2entropy_array
+
+    rnd = np.random.default_rng(0)
+    entropy = rnd.integers(0, 256, (count, 32), dtype=np.uint8)
+    checksums = rnd.integers(0, 256, count, dtype=np.uint8)
+    rows, checksum_rows = [bytes(row) for row in entropy], checksums.tolist()
+    idxs = entropy2idxs_array(entropy, checksums)
+    assert idxs.tolist() == [to2048(int.from_bytes(row, 'big') << 8 | c, 24) for row, c in zip(rows, checksum_rows)]
+    assert (idxs2entropy_array(idxs)[0] == entropy).all()
+
+    idx_rows = idxs.tolist()
+    loop_pack = timed(lambda: [to2048(int.from_bytes(row, 'big') << 8 | c, 24) for row, c in zip(rows, checksum_rows)], 1)
+    loop_unpack = timed(lambda: [(from2048(row) >> 8).to_bytes(32, 'big') for row in idx_rows], 1)
+    pack = timed(lambda: entropy2idxs_array(entropy, checksums), 1)
+    unpack = timed(lambda: idxs2entropy_array(idxs), 1)
+    print(f"  {count} phrases: entropy -> idxs to2048 {loop_pack / 1000:7.1f} ms, array {pack / 1000:6.1f} ms ({entropy.nbytes / pack:6.0f} MB/s)")
+    print(f"  {count} phrases: idxs -> entropy from2048 {loop_unpack / 1000:5.1f} ms, array {unpack / 1000:6.1f} ms ({entropy.nbytes / unpack:6.0f} MB/s)")
+
+### every valid checksum word of a phrase: to_bytes per candidate vs. the reused entropy buffer, then a batch in processes
+def bench_checksum(count=2000):
+    import hashlib
+    from .checksum import SEED_PARAMS, idxs2entropy, checksum_idxs, checksum_idxs_batch
+
+    def old_checksum_idxs(idxs):
+        _, checksum_bits, entropy_size = SEED_PARAMS[len(idxs) + 1]
+        entropy_base = idxs2entropy(idxs) << (11 - checksum_bits)
+        return [(i << checksum_bits) + (hashlib.sha256((entropy_base | i).to_bytes(entropy_size, 'big')).digest()[0] >> (8 - checksum_bits)) for i in range(2 ** (11 - checksum_bits))]
+
+    rnd = random.Random(0)
+    for words in SEED_PARAMS:
+        phrases = [[rnd.randrange(2048) for _ in range(words - 1)] for _ in range(count)]
+        assert [old_checksum_idxs(p) for p in phrases] == [checksum_idxs(p) for p in phrases]
+        old = timed(lambda: [old_checksum_idxs(p) for p in phrases], 1) / count
+        new = timed(lambda: [checksum_idxs(p) for p in phrases], 1) / count
+        print(f"  {words} words, {len(checksum_idxs(phrases[0])):3d} candidates: to_bytes {old:7.1f} us/phrase, buffer {new:7.1f} us/phrase ({1 - new / old:4.0%} saved)")
+
+    phrases = [[rnd.randrange(2048) for _ in range(11)] for _ in range(count * 10)]
+    serial = checksum_idxs_batch(phrases)
+    for processes in sorted({2, os.cpu_count() or 1} - {1}):
+        start = time.perf_counter()
+        assert checksum_idxs_batch(phrases, processes) == serial
+        print(f"  12 words, {processes:3d} processes: {len(phrases) / (time.perf_counter() - start):10.0f} phrases/s")
+
+### bip39.validate throughput over 24 word english phrases, serial vs. process pool, phrases/s
+def bench_validate(count=20000):
+    from .wordlist import EN_LIST
+    from .checksum import checksum_idx
+    from .validate import validate_phrases, validate_phrases_parallel
+
+    rnd = random.Random(0)
+    phrases = []
+    for _ in range(count):
+        idxs = [rnd.randrange(2048) for _ in range(23)]
+        phrases.append(' '.join(EN_LIST[i] for i in idxs + [checksum_idx(idxs)]))
+
+    start = time.perf_counter()
+    serial = list(validate_phrases(phrases))
+    print(f"  serial       : {count / (time.perf_counter() - start):10.0f} phrases/s")
+    assert all(status == 'valid' for status, *_ in serial)
+
+    for processes in sorted({2, os.cpu_count() or 1} - {1}):
+        start = time.perf_counter()
+        assert list(validate_phrases_parallel(phrases, processes=processes)) == serial
+        print(f"  {processes:3d} processes: {count / (time.perf_counter() - start):10.0f} phrases/s")
+
+### bip39.seed PBKDF2 derivation: serial vs. thread pool vs. process pool, seeds/s
+def bench_seed(count=400):
+    from .wordlist import EN_LIST
+    from .seed import derive_seeds
+
+    rnd = random.Random(0)
+    phrases = [' '.join(rnd.choices(EN_LIST, k=24)) for _ in range(count)]
+
+    start = time.perf_counter()
+    serial = list(derive_seeds(phrases, workers=1))
+    print(f"  serial             : {count / (time.perf_counter() - start):8.0f} seeds/s")
+
+    for executor in ('thread', 'process'):
+        for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            assert list(derive_seeds(phrases, workers=workers, executor=executor)) == serial
+            print(f"  {workers:3d} {executor:<7} workers: {count / (time.perf_counter() - start):8.0f} seeds/s")
+
+### bip39.translate: 24 word chinese phrases into all ten languages in one pass, phrases/s
+def bench_translate(count=20000):
+    from .wordlist import LANGUAGES
+    from .translate import translate_phrases
+
+    rnd = random.Random(0)
+    phrases = [' '.join(rnd.choices(CN_LIST, k=24)) for _ in range(count)]
+    for from_language in ('CHINESE_SIMPLIFIED', 'AUTO'):
+        start = time.perf_counter()
+        for _ in translate_phrases(phrases, from_language, LANGUAGES):
+            pass
+        print(f"  from {from_language:<18}: {count / (time.perf_counter() - start):8.0f} phrases/s into {len(LANGUAGES)} languages")
+
+### memory held per v3 generate_seedphrase result: the SeedPhrase object vs. the 9-tuple it replaced, bytes/result
+def bench_results(count=5000):
+    import tracemalloc
+    from .cn2en_v3 import generate_seedphrase
+
+    records = random_records(count)
+    tracemalloc.start()
+    results = [generate_seedphrase(23, cn_input, passcode, 1) for cn_input, passcode in records]
+    compact = tracemalloc.get_traced_memory()[0]
+    tuples = [tuple(result) for result in results]
+    eager = tracemalloc.get_traced_memory()[0] - compact
+    tracemalloc.stop()
+    print(f"  SeedPhrase {compact / count:6.0f} bytes/result, 9-tuple {eager / count:6.0f} bytes/result")
+
+### splitting chinese input into the wordlist characters and the excluded ones: per character loop with string
+### concatenation vs. the 2 str.translate passes, for a short phrase and a pasted paragraph, MB/s of input
+def bench_filter(number=20):
+    from .wordlist import split_chars
+
+    def loop(text):
+        effective, excluded = '', ''
+        for s in text:
+            if s in CN_LIST:
+                effective += s
+            else:
+                excluded += s
+        return effective, excluded
+
+    rnd = random.Random(0)
+    pool = list(CN_LIST) + list('，。、！？：；（）《》“” 0123456789abcxyz的們這個')
+    for name, size in (('phrase', 30), ('paragraph', 20000), ('document', 1000000)):
+        text = ''.join(rnd.choices(pool, k=size))
+        repeat = max(1, number * 20000 // size)
+        mb = len(text.encode('utf-8')) / 1e6
+        old = timed(lambda: loop(text), repeat)
+        new = timed(lambda: split_chars(text, CN_LIST), repeat)
+        print(f"  {name:>9} ({size:7} chars): loop {mb / old * 1e6:7.1f} MB/s, str.translate {mb / new * 1e6:7.1f} MB/s")
+
+### semaj word tokenizing of pasted text: one str.replace per separator + double space passes vs. the compiled
+### translate table + split() tokenizer, MB/s of input
+def bench_tokenize(number=20):
+    from .semaj import SEPARATORS, get_tokenizer
+    from .wordlist import get_wordlist
+
+    src_list = get_wordlist('ENGLISH')
+    def replace_loop(text):
+        text = text.lower()
+        for cr in SEPARATORS:
+            text = text.replace(cr, ' ')
+        words = text.replace('  ', ' ').replace('  ', ' ').split(' ')
+        return [w for w in words if w in src_list], [w for w in words if w not in src_list]
+
+    rnd = random.Random(0)
+    words = list(src_list) + ['Hello,', 'world!!', '(1984)', 'e.g.', '--', 'zoo;']
+    tokenize = get_tokenizer('ENGLISH')
+    for name, size in (('sentence', 20), ('paragraph', 2000), ('essay', 200000)):
+        text = ' '.join(rnd.choices(words, k=size))
+        repeat = max(1, number * 2000 // size)
+        mb = len(text.encode('utf-8')) / 1e6
+        old = timed(lambda: replace_loop(text), repeat)
+        new = timed(lambda: tokenize(text), repeat)
+        print(f"  {name:>9} ({size:6} words): replace loop {mb / old * 1e6:7.1f} MB/s, tokenizer {mb / new * 1e6:7.1f} MB/s")
+
+### bip39.semaj streaming evaluation: time and peak memory of generate_seedphrase on a long essay and of the stream on
+### the same essay in chunks (the stream is checked against the old implementation in tests/test_semaj_stream.py)
+def bench_stream(essay_words=500000):
+    import tracemalloc
+    from .semaj import generate_seedphrase, generate_seedphrase_stream
+    from .wordlist import get_wordlist
+
+    rnd = random.Random(0)
+    essay = ' '.join(rnd.choices(list(get_wordlist('ENGLISH')) + ['Hello,', 'world!!', '(1984)'], k=essay_words))
+    for name, run in (('whole text', lambda: generate_seedphrase('ENGLISH', essay, 12345)),
+                      ('stream', lambda: generate_seedphrase_stream('ENGLISH', (essay[i:i + 65536] for i in range(0, len(essay), 65536)), 12345))):
+        tracemalloc.start()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name:>10}: {essay_words} word essay in {elapsed * 1e3:7.1f} ms, peak {peak / 1e6:6.1f} MB on top of the text")
+
+### bip39.corpus sliding windows: windows/s of the rolling windows vs. one generate_seedphrase call per window (the
+### windows and sentences are checked against generate_seedphrase in tests/test_corpus.py)
+def bench_corpus(windows=20000):
+    from .cn2en_v3 import generate_seedphrase
+    from .corpus import window_seedphrases
+
+    rnd = random.Random(0)
+    text = ''.join(rnd.choices(CN_LIST, k=windows + 22))
+    for bit_wise_add in (0, 1):
+        start = time.perf_counter()
+        for i in range(windows):
+            generate_seedphrase(23, text[i:i + 23], 'passcode', bit_wise_add)
+        recompute = windows / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for _ in window_seedphrases([text], 'passcode', 23, bit_wise_add):
+            pass
+        rolling = windows / (time.perf_counter() - start)
+        print(f"  bit_wise_add {bit_wise_add}: generate_seedphrase per window {recompute:8.0f} windows/s, rolling windows {rolling:8.0f} windows/s")
+
+### bip39.batch passcode derivation: hashed per record (a cache of size 0) vs. once per distinct passcode, for a batch
+### sharing one passcode, a few hundred and all distinct, records/s and the hashing work the cache saved
+def bench_passcode(count=50000):
+    from .batch import generate_seedphrases, PasscodeCache
+
+    rnd = random.Random(0)
+    inputs = [''.join(rnd.choices(CN_LIST, k=30)) for _ in range(count)]
+    for name, passcode_strs in (('1 passcode', ['passcode'] * count), ('300 passcodes', [str(rnd.randrange(300)) for _ in range(count)]),
+                                ('all distinct', [str(i) for i in range(count)])):
+        records = list(zip(inputs, passcode_strs))
+        rates = []
+        for maxsize in (0, 1 << 16):
+            best = 0
+            for _ in range(3):
+                passcodes = PasscodeCache(maxsize=maxsize)
+                start = time.perf_counter()
+                for _ in generate_seedphrases(records, 23, 1, passcodes):
+                    pass
+                best = max(best, count / (time.perf_counter() - start))
+            rates.append(best)
+        print(f"  {name:>13}: per record {rates[0]:8.0f} records/s, hoisted {rates[1]:8.0f} records/s - {passcodes.report()}")
+
+### start up of every entry point in a fresh interpreter: cumulative import time of the launcher (-X importtime)
+### and the wall time of the whole process, ms
+STARTUP_LAUNCHERS = (
+    'bip39_translate_cn2en', 'bip39_translate_cn2en_v2', 'bip39_translate_cn2en_v3',
+    'semaj_seed_phrase_generator', 'semaj_seed_phrase_generator_v2', 'int_base_converter',
+    'bip39_batch', 'bip39_seed', 'bip39_validate', 'bip39_translate', 'bip39_corpus',
+)
+
+def bench_startup(repeat=5):
+    import subprocess
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for launcher in STARTUP_LAUNCHERS:
+        imports, walls = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {launcher}'], cwd=root,
+                                    capture_output=True, text=True, check=True).stderr
+            walls.append(time.perf_counter() - start)
+            ### last line is the launcher itself: "import time: self [us] | cumulative | name"
+            imports.append(int(stderr.strip().splitlines()[-1].split('|')[1]))
+        print(f"  {launcher:<31}: import {min(imports) / 1e3:6.1f} ms, process {min(walls) * 1e3:6.1f} ms")
+
+BENCHMARKS = {
+    'index' : bench_index,
+    'batch' : bench_batch,
+    'radix' : bench_radix,
+    'entropy' : bench_entropy,
+    'combine' : bench_combine,
+    'codec' : bench_codec,
+    'checksum' : bench_checksum,
+    'validate' : bench_validate,
+    'seed' : bench_seed,
+    'translate' : bench_translate,
+    'results' : bench_results,
+    'filter' : bench_filter,
+    'tokenize' : bench_tokenize,
+    'stream' : bench_stream,
+    'corpus' : bench_corpus,
+    'passcode' : bench_passcode,
+    'startup' : bench_startup,
+}
+
+def main():
+    for name in (sys.argv[1:] or BENCHMARKS):
+        print(f"### {name}")
+        BENCHMARKS[name]()
+
+if __name__ == "__main__":
+    main()
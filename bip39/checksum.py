@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### BIP39 checksum (last word) engine
+###
+### Replaces the Bip39Check helper class that every generate_seedphrase call used to construct (rebuilding a 2048 entry
+### dict each time) and then drive through mutable state (_check_size / _compute_entropy / _scan).
+### The functions hold no per phrase state and work on word indexes (or raw entropy bytes) directly: every caller already
+### holds the indexes, words are only produced at the output boundary (wordlist[i]).
+
+import hashlib
+
+### every standard BIP39 seed phrase length, words -> (entropy bits, checksum bits, entropy bytes), computed once here so
+### callers (and batches mixing lengths) only do a lookup: 12 -> (128, 4, 16), 15 -> (160, 5, 20) ... 24 -> (256, 8, 32)
+SEED_LENGTHS = (12, 15, 18, 21, 24)
+SEED_PARAMS = {words: (words * 32 // 3, words // 3, words * 4 // 3) for words in SEED_LENGTHS}
+ENTROPY_PARAMS = {entropy_bytes: (words, checksum_bits) for words, (_, checksum_bits, entropy_bytes) in SEED_PARAMS.items()}   ### entropy bytes -> (words, checksum bits)
+
+def seed_params(size):
+    ### size: number of words of the full seed phrase, including the checksum word -> (entropy bits, checksum bits, entropy bytes)
+    params = SEED_PARAMS.get(size)
+    if params is None:
+        raise ValueError(f'Expecting {", ".join(map(str, SEED_LENGTHS[:-1]))} or {SEED_LENGTHS[-1]} words (including the checksum word), not {size}')
+    return params
+
+def _checksum_params(size):
+    _, checksum_bits, entropy_size = seed_params(size)
+    return checksum_bits, entropy_size
+
+def _scan(entropy, size, first_only=False):
+    ### entropy: the words before the checksum word as one integer, 11 bits per word
+    ### returns the word indexes of the valid checksum words - only the first one if first_only
+    ### the 11 - checksum_bits candidate bits (3 for 24 words ... 7 for 12 words) are the low bits of the last entropy byte,
+    ### so the entropy bytes are built once and only that byte is rewritten per candidate - no to_bytes per candidate.
+    ### The sha256 of each candidate (a single 64 byte block) is most of the cost and stays, the buffer saves about 10 - 15%
+    ### of the time per phrase for every length (see bip39_benchmark.py checksum)
+    checksum_bits, entropy_size = _checksum_params(size)
+    entropy_to_fill = 11 - checksum_bits
+    checksum_shift = 8 - checksum_bits
+    entropy_buffer = bytearray((entropy << entropy_to_fill).to_bytes(entropy_size, 'big'))
+    entropy_last = entropy_buffer[-1]
+    sha256 = hashlib.sha256
+
+    checkword_idxs = []
+    for i in range(1 if first_only else 1 << entropy_to_fill):
+        entropy_buffer[-1] = entropy_last | i
+        checkword_idxs.append((i << checksum_bits) | sha256(entropy_buffer).digest()[0] >> checksum_shift)
+    return checkword_idxs
+
+def idxs2entropy(idxs):
+    entropy = 0
+    for idx in idxs:
+        entropy = (entropy << 11) | idx
+    return entropy
+
+def checksum_idx(idxs):
+    ### idxs: word indexes of the phrase before the checksum word -> index of the first valid checksum word
+    return _scan(idxs2entropy(idxs), len(idxs) + 1, first_only=True)[0]
+
+def value_checksum_idx(value, size):
+    ### value: the words before the checksum word as one integer (idxs2entropy), size: words including the checksum word
+    ### -> index of the first valid checksum word, for callers keeping the phrase as an integer (bip39.corpus)
+    return _scan(value, size, first_only=True)[0]
+
+def checksum_idxs(idxs):
+    ### idxs: word indexes of the phrase before the checksum word -> indexes of every valid checksum word
+    return _scan(idxs2entropy(idxs), len(idxs) + 1)
+
+def expected_checksum_idx(idxs):
+    ### idxs: word indexes of a full phrase, checksum word included -> the last word it should have: the entropy bits of
+    ### its last word kept, the checksum bits recomputed (the same as idxs[-1] for a valid phrase)
+    _, checksum_bits, entropy_size = seed_params(len(idxs))
+    entropy = idxs2entropy(idxs) >> checksum_bits
+    checksum = hashlib.sha256(entropy.to_bytes(entropy_size, 'big')).digest()[0] >> (8 - checksum_bits)
+    return (idxs[-1] >> checksum_bits << checksum_bits) | checksum
+
+def checksum_valid(idxs):
+    ### idxs: word indexes of a full phrase, checksum word included
+    return expected_checksum_idx(idxs) == idxs[-1]
+
+def checksum_idxs_batch(phrases_idxs, processes=1, chunksize=256):
+    ### phrases_idxs: word indexes of many phrases (before the checksum word), lengths may be mixed
+    ### -> the list of every valid checksum word index of each phrase, in input order - from a process pool if processes != 1
+    if processes == 1:
+        return [checksum_idxs(idxs) for idxs in phrases_idxs]
+    import concurrent.futures   ### pulls in logging etc., only imported when a pool is asked for
+    with concurrent.futures.ProcessPoolExecutor(processes or None) as pool:
+        return list(pool.map(checksum_idxs, phrases_idxs, chunksize=chunksize))
+
+def entropy_checksum_idx(entropy):
+    ### entropy: raw entropy bytes (16, 20, 24, 28 or 32 bytes for 12 - 24 words) -> index of the checksum (last) word,
+    ### which carries the last 11 - checksum_bits bits of the entropy followed by the checksum bits
+    if len(entropy) not in ENTROPY_PARAMS:
+        raise ValueError(f'Expecting {", ".join(map(str, ENTROPY_PARAMS))} bytes of entropy, not {len(entropy)}')
+    checksum_bits = ENTROPY_PARAMS[len(entropy)][1]
+    entropy_tail = int.from_bytes(entropy[-2:], 'big') & ((1 << (11 - checksum_bits)) - 1)
+    checksum = hashlib.sha256(entropy).digest()[0] >> (8 - checksum_bits)
+    return (entropy_tail << checksum_bits) | checksum
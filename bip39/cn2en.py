@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import hashlib
+
+### with open('chinese_simplified.txt', 'r') as f: cn=''.join(f.readlines()).strip().split('\n')
+### with open('english.txt', 'r') as f: en=''.join(f.readlines()).strip().split('\n')
+
+from .wordlist import CN_LIST, EN_LIST, split_chars   ### the 2 lists are sourced from : https://github.com/bitcoin/bips/tree/master/bip-0039
+from .checksum import seed_params   ### entropy / checksum sizes of the 12 - 24 word lengths
+
+def __getattr__(name):
+    ### CN2EN_DICT / EN2CN_DICT as the script had them, built by bip39.wordlist on first access
+    if name in ('CN2EN_DICT', 'EN2CN_DICT'):
+        from . import wordlist
+        return getattr(wordlist, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class Bip39Check(object):
+    def __init__(self):
+        self.radix = 2048
+        self.worddict = {}
+        self.wordlist = []
+
+        counter = 0
+
+        for w in EN_LIST:
+            word = w.strip() if sys.version < '3' else w.strip()
+            self.worddict[word] = counter
+            self.wordlist.append(word)
+            counter = counter + 1
+
+        if(len(self.worddict) != self.radix):
+            print(len(self.worddict), self.radix)
+            raise ValueError('Expecting %d words, not %d', self.radix, len(self.worddict))
+
+    def _check_size(self, phrase):
+        self.size = len(phrase) + 1
+        seed_params(self.size)
+
+    def _compute_entropy(self, phrase):
+        self.entropy = 0
+        for w in phrase:
+            idx = self.worddict[w]
+            self.entropy = (self.entropy << 11) + idx
+        return self.entropy
+
+    def _scan(self):
+        _, checksum_bits, entropy_size = seed_params(self.size)
+        entropy_to_fill = 11 - checksum_bits
+        entropy_base = self.entropy << (entropy_to_fill)
+
+        for i in range(0, 2 ** entropy_to_fill):
+            entropy_candidate = entropy_base | i
+            entropy_str = (entropy_candidate).to_bytes(entropy_size, 'big')
+            hash = (hashlib.sha256(entropy_str).digest()[0])
+            checksum = hash >> (8 - checksum_bits)
+            final_word_idx = (i << checksum_bits) + checksum
+            checkword = self.wordlist[final_word_idx]
+            print (checkword)
+            return checkword
+
+
+
+def main():
+    from .wordlist import CN2EN_DICT, EN2CN_DICT   ### built on first use
+    cn, en = CN_LIST, EN_LIST
+
+    cn_length_input = input(f'Please choose your length of target seed phrases (e.g. 12, 24, etc. default 24):')
+    if cn_length_input.isnumeric():
+        cn_length = int(cn_length_input)
+        print(f'Received input of target length: {cn_length}!')
+    else:
+        cn_length = 24
+        print(f'Using default length: {cn_length}!')
+
+    ### last word of the seed phrase are generated automatically
+    cn_length = cn_length - 1
+
+    cn_en_dict, en_cn_dict = CN2EN_DICT, EN2CN_DICT
+    cn_input = input(f'Please type in your {cn_length} Chinese characters (It will only take first {cn_length} if too long. It will repeat from beginning if too short.)\n===>')
+
+    cn_codes, cn_delete = split_chars(cn_input, cn)
+    cn_use = cn_codes.translate(cn)
+    cn_delete = set(cn_delete)
+    print(f"{cn_delete} is not in the list of the 2048 Chinese characters. They are REMOVED from the phrase generation!!!\nPlease take notes!!! Effective input is {cn_use}")
+
+    if len(cn_use) < 6:
+        print("Please use a longer phrase!!! At least 6 characters!!!")
+        exit()
+
+    cn_output = ''
+    en_output = []
+    while len(cn_output) < cn_length:
+        for s in cn_use:
+            cn_output += s
+            en_output.append(cn_en_dict[s])
+
+    m = Bip39Check()
+    m._check_size(en_output[:cn_length])
+    m._compute_entropy(en_output[:cn_length])
+    last_word = m._scan()
+    print(f'Auto-generated checksum last_word is: {last_word}, {en_cn_dict[last_word]}')
+
+    en_output, cn_output = en_output[:cn_length] + [last_word], cn_output[:cn_length] + en_cn_dict[last_word]
+
+    print(f"Your seed phrases are as below:\n Chinese (len:({len(cn_output)})): {''.join(cn_output)}\n English (len:({len(en_output)})): {','.join(en_output)}")
+
+    num_output = dict(zip(range(1,25), en_output))
+    print(f"Your seed phrases with numbers are as below:\n English : {num_output}")
+
+if __name__ == "__main__":
+    main()
+
+### TESTS
+### jzzheng@rtx4090:~/bip-0039$ ./translate_cn2en.py
+### Please choose your length of target seed phrases (e.g. 12, 24, etc. default 24):
+### Using default length: 24!
+### Please type in your 23 Chinese characters (It will only take first 23 if too long. It will repeat from beginning if too short.)
+### ===>秦朝（前221年—前207年），是中国历史上第一个统一的封建王朝，前身是春秋战国时期的秦国
+### {'2', '0', '）', '（', '7', '1', '，', '—'} is not in the list of the 2048 Chinese characters. They are REMOVED from the phrase generation!!!
+### Please take notes!!! Effective input is 秦朝前年前年是中国历史上第一个统一的封建王朝前身是春秋战国时期的秦国
+### aisle
+### Auto-generated checksum last_word is: aisle, 过
+### Your seed phrases are as below:
+###  Chinese (len:(24)): 秦朝前年前年是中国历史上第一个统一的封建王朝前过
+###  English (len:(24)): mention,else,atom,age,atom,age,able,access,acid,cube,cruel,accuse,battle,ability,achieve,bridge,ability,abandon,eagle,belt,define,else,atom,aisle
+###
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### By James Zheng 19-Sep-2024
+###
+### Methodology:
+### 1. calculate SHA256 of the given passcode ( in utf-8 ) - if no passcode provided, the number will be set to 0
+### 2. convert it into a 24 digit base2048 number
+### 3. reverse the digit of the number - smallest goes first and put largest at the end, fill the endings with 0s if number is too small
+### 4. add the digits onto chinese seedphase index, one-to-one
+### 5. convert the indexes into english seedphrase
+
+### References:
+### below 2 lists are sourced from : https://github.com/bitcoin/bips/tree/master/bip-0039
+### as of 8-Apr-2024
+
+### TESTS
+### 
+### ------ without passcode ------
+### 
+### jzzheng@rtx:~$ bip39_translate_cn2en_v2.py -c
+### Please choose your length of target seed phrases (e.g. 12, 24, etc. default 24):
+### Using default length: 24!
+### Please type in your 23 Chinese characters (It will only take first 23 if too long. It will repeat from beginning if too short.)
+### ===>秦朝（前221年—前207年），是中国历史上第一个统一的封建王朝，前身是春秋战国时期的秦国
+### Please enter a pass code:	E.g. 12354, or A1123xx$#@, etc.
+### It can be in any length (empty for not using this code), can be any type-able ascii characters (except leading or ending spaces), and it is case sensitive!!!
+### Please remember this code - without this code you will never be able to retrieve the target passphrase!!!
+### ===>
+### ########################
+### {'（', '1', '—', '，', '0', '7', '）', '2'} is not in the list of the 2048 Chinese characters. They are REMOVED from the phrase generation!!!
+### Auto-generated checksum last_word is: aisle, 过
+### Effective Chinese input is:[len:23]: 秦朝前年前年是中国历史上第一个统一的封建王朝前
+### Chinese indexes:
+### 	[1112, 577, 114, 38, 114, 38, 2, 10, 15, 427, 420, 13, 154, 1, 14, 222, 1, 0, 552, 167, 460, 577, 114]
+### SHA256ed-to-Base2048 of passcode '' is (len:(24)):
+### 	[0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+### English passphrase indexes:
+### 	[1112, 577, 114, 38, 114, 38, 2, 10, 15, 427, 420, 13, 154, 1, 14, 222, 1, 0, 552, 167, 460, 577, 114]
+### ########################
+### Your passphrase [len:24]:
+### mention else atom age atom age able access acid cube cruel accuse battle ability achieve bridge ability abandon eagle belt define else atom aisle
+### {1: 'mention', 2: 'else', 3: 'atom', 4: 'age', 5: 'atom', 6: 'age', 7: 'able', 8: 'access', 9: 'acid', 10: 'cube', 11: 'cruel', 12: 'accuse', 13: 'battle', 14: 'ability', 15: 'achieve', 16: 'bridge', 17: 'ability', 18: 'abandon', 19: 'eagle', 20: 'belt', 21: 'define', 22: 'else', 23: 'atom', 24: 'aisle'}
+### 
+### ------ with passcode ------
+### 
+### jzzheng@rtx:~$ bip39_translate_cn2en_v2.py -c
+### Please choose your length of target seed phrases (e.g. 12, 24, etc. default 24):
+### Using default length: 24!
+### Please type in your 23 Chinese characters (It will only take first 23 if too long. It will repeat from beginning if too short.)
+### ===>秦朝（前221年—前207年），是中国历史上第一个统一的封建王朝，前身是春秋战国时期的秦国
+### Please enter a pass code:	E.g. 12354, or A1123xx$#@, etc.
+### It can be in any length (empty for not using this code), can be any type-able ascii characters (except leading or ending spaces), and it is case sensitive!!!
+### Please remember this code - without this code you will never be able to retrieve the target passphrase!!!
+### ===>123
+### CODE: hashlib.sha256("123".encode("utf-8")).hexdigest() ==> for passcode: "123" is: "a665a45920422f9d417e4867efdc4fb8a04a1f3fff1fa07e998e86f7f7a27ae3"
+### CODE: int("a665a45920422f9d417e4867efdc4fb8a04a1f3fff1fa07e998e86f7f7a27ae3", 16) ==> for decimal value of the hex a665a45920422f9d417e4867efdc4fb8a04a1f3fff1fa07e998e86f7f7a27ae3 is : 75263518707598184987916378021939673586055614731957507592904438851787542395619
+### Converted into base2048 value in reverse_order:True is :
+### [739, 1103, 2014, 891, 232, 1331, 31, 253, 2047, 999, 296, 1104, 1275, 1976, 507, 579, 382, 936, 190, 33, 1426, 840, 409, 5]
+### ########################
+### {'0', '（', '，', '）', '—', '7', '1', '2'} is not in the list of the 2048 Chinese characters. They are REMOVED from the phrase generation!!!
+### Auto-generated checksum last_word is: around, 从
+### Effective Chinese input is:[len:23]: 秦朝前年前年是中国历史上第一个统一的封建王朝前
+### Chinese indexes:
+### 	[1112, 577, 114, 38, 114, 38, 2, 10, 15, 427, 420, 13, 154, 1, 14, 222, 1, 0, 552, 167, 460, 577, 114]
+### SHA256ed-to-Base2048 of passcode '123' is (len:(24)):
+### 	[739, 1103, 2014, 891, 232, 1331, 31, 253, 2047, 999, 296, 1104, 1275, 1976, 507, 579, 382, 936, 190, 33, 1426, 840, 409, 5]
+### English passphrase indexes:
+### 	[1851, 1680, 80, 929, 346, 1369, 33, 263, 14, 1426, 716, 1117, 1429, 1977, 521, 801, 383, 936, 742, 200, 1886, 1417, 523]
+### ########################
+### Your passphrase [len:24]:
+### trash spirit anxiety injury clip private aerobic can achieve rather flower merry razor warm donkey goddess copper insect fresh boil type raise door around
+### {1: 'trash', 2: 'spirit', 3: 'anxiety', 4: 'injury', 5: 'clip', 6: 'private', 7: 'aerobic', 8: 'can', 9: 'achieve', 10: 'rather', 11: 'flower', 12: 'merry', 13: 'razor', 14: 'warm', 15: 'donkey', 16: 'goddess', 17: 'copper', 18: 'insect', 19: 'fresh', 20: 'boil', 21: 'type', 22: 'raise', 23: 'door', 24: 'around'}
+
+
+import os
+import sys
+import hashlib
+
+from .wordlist import NO_OF_WORDS, CN_LIST, EN_LIST, split_chars, repeat_codes   ### CONSTANT LISTS - shared, verified by sha256 on first use
+from .checksum import SEED_LENGTHS, checksum_idx
+from .radix2048 import to2048
+
+def __getattr__(name):
+    ### EN2CN_DICT as the script had it, built by bip39.wordlist on first access
+    if name in ('EN2CN_DICT',):
+        from . import wordlist
+        return getattr(wordlist, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+### helper function to convert ascii passcode into a base2048 number using sha256
+### no I/O: the steps are only explained when a trace list is given - the lines are added to it for the CLI to print
+def passcode_sha256_to_base_2048(passcode, reverse_order, trace=None):
+    hex_str = hashlib.sha256(passcode.encode('utf-8')).hexdigest()
+    decimal_value = int(hex_str, 16)
+
+    base_2048_digits = to2048(decimal_value, 24)   ### Pad with leading zeros at the start
+
+    if reverse_order:
+        base_2048_digits.reverse()
+
+    if trace is not None:
+        trace.append(f'CODE: hashlib.sha256("{passcode}".encode("utf-8")).hexdigest() ==> for passcode: "{passcode}" is: "{hex_str}"')
+        trace.append(f'CODE: int("{hex_str}", 16) ==> for decimal value of the hex {hex_str} is : {decimal_value}')
+        trace.append(f'Converted into base2048 value in reverse_order:{reverse_order} is :\n{base_2048_digits}')
+    return base_2048_digits
+
+### seedphrase generator
+def generate_seedphrase(effective_code_length, cn_input, passcode_str, trace=None):
+    try:
+        cn_codes, cn_char_excluded = split_chars(cn_input, CN_LIST)   ### whole input in 2 str.translate passes: wordlist chars as chr(index) / the rest
+        cn_char_excluded = set(cn_char_excluded)
+
+        passcode = [0] * effective_code_length   ### set all into 0 as default, so that the_passcode+1 times phrase_number and take the remainder of division over NO_OF_WORDS should be phrase_number itself -> meaning no passcode
+        if passcode_str:
+            passcode = passcode_sha256_to_base_2048(passcode_str, True, trace)   ### logic : reverse the base2048 output, take the pcode from smallest digit first
+        
+        cn_codes = repeat_codes(cn_codes, effective_code_length)   ### logic : if effective chinese string not available -> use first char, set idx to 0
+        cn_char_effective = cn_codes.translate(CN_LIST)
+        cn_idxs = list(map(ord, cn_codes))
+
+        en_idxs = [( cn_idxs[i] + passcode[i] ) % NO_OF_WORDS for i in range(effective_code_length)]   ### logic : c = (x + p) mod ( NO_OF_WORDS ) ---> c: coded number, x: cn idx number, p: passcode
+        
+        ### generate the last checksum code - straight from the indexes, words are only produced for the output
+        last_word = EN_LIST[checksum_idx(en_idxs)]
+        
+        en_output = [EN_LIST[i] for i in en_idxs] + [last_word]
+        en_indexed_output = dict(zip(range(1, len(en_output)+1), en_output))
+        return cn_char_excluded, cn_char_effective, passcode, cn_idxs, en_idxs, en_output, en_indexed_output, last_word
+
+    except Exception as e:
+        raise Exception(f"Error in generate_seedphrase: {e}")
+
+### command line main function
+def main_cli():
+    from .wordlist import EN2CN_DICT   ### only the CLI output needs it, built on first use
+    cn_length_input = input(f'Please choose your length of target seed phrases ({", ".join(map(str, SEED_LENGTHS))}, default 24):')
+    if cn_length_input.isnumeric():
+        cn_length = int(cn_length_input)
+        print(f'Received input of target length: {cn_length}!')
+    else:
+        cn_length = 24
+        print(f'Using default length: {cn_length}!')
+
+    ### last word of the seed phrase are generated automatically - so the effective length is l - 1, e.g. 24 -> 23
+    effective_code_length = cn_length - 1
+    cn_input = input(f'Please type in your {effective_code_length} Chinese characters (It will only take first {effective_code_length} if too long. It will repeat from beginning if too short.)\n===>')
+    passcode_str_raw = input(f'Please enter a pass code:\tE.g. 12354, or A1123xx$#@, etc.\nIt can be in any length (empty for not using this code), can be any type-able ascii characters (except leading or ending spaces), and it is case sensitive!!!\nPlease remember this code - without this code you will never be able to retrieve the target passphrase!!!\n===>')
+    passcode_str = passcode_str_raw.strip()
+
+    trace = []
+    cn_char_excluded, cn_char_effective, passcode, cn_idxs, en_idxs, en_output, en_indexed_output, last_word = generate_seedphrase(effective_code_length, cn_input, passcode_str, trace)
+    for line in trace:
+        print(line)
+
+    print("#"*24)
+    if cn_char_excluded:
+        print(f"{cn_char_excluded} is not in the list of the 2048 Chinese characters. They are REMOVED from the phrase generation!!!")
+    print(f'Auto-generated checksum last_word is: {last_word}, {EN2CN_DICT[last_word]}')
+    print(f"Effective Chinese input is:[len:{len(cn_char_effective)}]: {''.join(cn_char_effective)}")
+    print(f"Chinese indexes:\n\t{cn_idxs}")
+    print(f"SHA256ed-to-Base2048 of passcode '{passcode_str}' is (len:({len(en_output)})):\n\t{passcode}")
+    print(f"English passphrase indexes:\n\t{en_idxs}")
+    print("#"*24)
+    print(f"Your passphrase [len:{len(en_output)}]:\n{' '.join(en_output)}\n{en_indexed_output}")
+
+### tkinter ui main function
+def main_ui():
+    import tkinter as tk
+    def generate_output():
+        cn_input_raw = entry1.get()
+        passcode_str_raw = entry2.get()
+        seed_length = seedphrase_length.get()
+
+        cn_input = cn_input_raw.strip()
+        passcode_str = passcode_str_raw.strip()
+        effective_code_length = int(seed_length) - 1
+        cn_char_excluded, cn_char_effective, passcode, cn_idxs, en_idxs, en_output, en_indexed_output, last_word = generate_seedphrase(effective_code_length, cn_input, passcode_str)
+    
+        output1.config(state="normal")
+        output2.config(state="normal")
+        output3.config(state="normal")
+
+        output1.delete(1.0, tk.END)
+        output2.delete(1.0, tk.END)
+        output3.delete(1.0, tk.END)
+    
+        output1.insert(tk.END, f"{''.join(cn_char_effective)}")
+        output2.insert(tk.END, f"{' '.join(en_output)}")
+        output3.insert(tk.END, f"{en_indexed_output}")
+
+        output1.config(state="disabled")
+        output2.config(state="disabled")
+        output3.config(state="disabled")
+    
+    root = tk.Tk()
+    root.title("Semaj's SeedPhrase Generator")
+    
+    root.grid_rowconfigure(0, weight=1)
+    root.grid_rowconfigure(1, weight=1)
+    root.grid_rowconfigure(2, weight=2)
+    root.grid_rowconfigure(3, weight=2)
+    root.grid_columnconfigure(0, weight=1)
+    
+    label1 = tk.Label(root, text="Please input your Chinese Phrases here", font=("Arial", 12), anchor='w')
+    entry1 = tk.Entry(root, font=("Arial", 14))
+    label2 = tk.Label(root, text="Please input your passcode here, it can be empty or any ascii code except space", font=("Arial", 12), anchor='w')
+    entry2 = tk.Entry(root, font=("Arial", 14))
+    
+    label1.grid(row=0, column=0, sticky="ew", padx=10, pady=5)
+    entry1.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
+    label2.grid(row=2, column=0, sticky="ew", padx=10, pady=5)
+    entry2.grid(row=3, column=0, sticky="ew", padx=10, pady=5)
+    
+    seedphrase_length = tk.StringVar(root)
+    seedphrase_length.set("24")
+    
+    dropdown = tk.OptionMenu(root, seedphrase_length, *map(str, SEED_LENGTHS))
+    dropdown.config(font=("Arial", 14))
+    dropdown.grid(row=4, column=0, sticky="w", padx=10, pady=5)
+
+    generate_button = tk.Button(root, text="Generate Seed Phrase", font=("Arial", 16), command=generate_output)
+    generate_button.grid(row=6, column=0, sticky="ew", padx=10, pady=10)
+    
+    output1 = tk.Text(root, height=2, wrap="word", font=("Arial", 12))
+    output2 = tk.Text(root, height=3, wrap="word", font=("Arial", 12))
+    output3 = tk.Text(root, height=4, wrap="word", font=("Arial", 12))
+    
+    label3 = tk.Label(root, text="Your input:", font=("Arial", 12), anchor='w')
+    label4 = tk.Label(root, text="Your Seed Phrase - Please keep them secure!!!", font=("Arial", 12), anchor='w')
+
+    label3.grid(row=7, column=0, sticky="ew", padx=10, pady=5)
+    output1.grid(row=8, column=0, sticky="ew", padx=10, pady=5)
+    label4.grid(row=9, column=0, sticky="ew", padx=10, pady=5)
+    output2.grid(row=10, column=0, sticky="ew", padx=10, pady=5)
+    output3.grid(row=11, column=0, sticky="ew", padx=10, pady=5)
+    
+    root.mainloop()
+
+def main():
+    if len(sys.argv) > 1 and '-c' in sys.argv[1:]:
+        main_cli()
+    else:
+        main_ui()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### Corpus mode on top of bip39.cn2en_v3: a seed phrase for every passage of a large chinese text
+###
+### window_seedphrases() takes text chunks and yields, for every window of effective_code_length consecutive wordlist
+### characters (1st - 23rd, 2nd - 24th, ...), the words generate_seedphrase() gives for that window:
+###   (window number = position of its first character among the wordlist characters, effective chinese input,
+###    tuple of the english word indexes including the checksum word)
+### A window is not rebuilt from its characters: it is kept as one integer of 11 bits per character, and moving it by one
+### character is a shift, an or and a mask. The passcode is derived once for the whole text, and both combining modes
+### work on that integer too:
+###   bit_wise_add 0 : (window + passcode hash) mod 2048**L
+###   bit_wise_add 1 : every 11 bit lane added mod 2048, without carries between lanes (_lane_add)
+### The checksum word comes straight from the combined integer (bip39.checksum.value_checksum_idx).
+###
+### sentence_seedphrases() yields one result per sentence (ending with 。！？；!?; or a new line) with a wordlist
+### character in it - the same as generate_seedphrase() for that sentence, see bip39.batch.generate_seedphrases.
+### Every sentence is translated to wordlist codes once, the codes both skip the sentences without wordlist characters
+### and go on to bip39.batch.generate_seedphrases_codes.
+###
+### read_text() memory-maps the file and decodes it block by block (incremental utf-8 decoder, a character cut at a block
+### end is completed by the next block), so memory stays flat for files of any size.
+###
+### File driver - one json line per window / sentence out:
+###   python bip39_corpus.py text.txt [output.jsonl, default/- stdout] [passcode, default none] [window/sentence, default window] [seed length 12/15/18/21/24, default 24] [combining mode 0/1, default 1]
+###   output window   : {"window": 0, "cn_effective": "...", "passphrase": "..."}
+###          sentence : {"sentence": 0, "cn_input": "...", "cn_effective": "...", "passphrase": "..."}
+
+import re
+import sys
+import json
+import mmap
+import codecs
+import itertools
+import contextlib
+
+from .wordlist import CN_LIST, EN_LIST
+from .checksum import seed_params, value_checksum_idx
+from .radix2048 import RADIX_BITS, to2048, from2048
+from .cn2en_v3 import passcode_to_base_2048
+from .batch import generate_seedphrases_codes
+
+BLOCK_SIZE = 1 << 20   ### bytes decoded at a time
+
+def read_text(path, block_size=BLOCK_SIZE):
+    with open(path, 'rb') as f:
+        if not f.seek(0, 2):
+            return   ### empty file, mmap does not take 0 bytes
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            for start in range(0, len(data), block_size):
+                yield decoder.decode(data[start:start + block_size])
+            yield decoder.decode(b'', final=True)
+
+def _lane_add(a, b, high_bits, low_bits):
+    ### 11 bit lanes of a and b added mod 2048 each: the low 10 bits of a lane can not carry out of the lane, the top bits
+    ### are added mod 2 by the xor
+    return ((a & low_bits) + (b & low_bits)) ^ ((a ^ b) & high_bits)
+
+def window_seedphrases(chunks, passcode_str='', effective_code_length=23, bit_wise_add=1):
+    size = effective_code_length + 1
+    seed_params(size)
+    value_bits = RADIX_BITS * effective_code_length
+    value_mask = (1 << value_bits) - 1
+    high_bits = sum(1 << (RADIX_BITS * i + RADIX_BITS - 1) for i in range(effective_code_length))   ### top bit of every lane
+    low_bits = value_mask ^ high_bits
+
+    passcode, passcode_hash_value = passcode_to_base_2048(passcode_str, True) if passcode_str else ([0] * 24, 0)
+    passcode_value = from2048(passcode[:effective_code_length])   ### the passcode digits of the bit-wise mode, as lanes
+
+    window, window_codes, count = 0, '', 0
+    for chunk in chunks:
+        codes = chunk.translate(CN_LIST.char_codes)   ### wordlist characters as chr(index), see bip39.wordlist
+        window_codes = window_codes[-(effective_code_length - 1):] + codes if effective_code_length > 1 else codes
+        offset = len(window_codes) - len(codes)   ### window_codes starts with the characters kept from the last chunk
+        for i, code in enumerate(codes):
+            window = ((window << RADIX_BITS) | ord(code)) & value_mask
+            count += 1
+            if count < effective_code_length:
+                continue
+
+            if bit_wise_add:
+                value = _lane_add(window, passcode_value, high_bits, low_bits)
+            else:
+                value = (window + passcode_hash_value) & value_mask
+            end = offset + i + 1
+            en_idxs = to2048(value, effective_code_length)
+            en_idxs.append(value_checksum_idx(value, size))
+            yield count - effective_code_length, window_codes[end - effective_code_length:end].translate(CN_LIST), tuple(en_idxs)
+
+_SENTENCE = re.compile(r'[^。！？；!?;\n]*[。！？；!?;\n]+')
+
+def split_sentences(chunks):
+    carry = ''
+    for chunk in chunks:
+        text = carry + chunk
+        end = 0
+        for match in _SENTENCE.finditer(text):
+            if match.end() == len(text):
+                break   ### the next chunk may start with more terminators of this sentence
+            yield match.group()
+            end = match.end()
+        carry = text[end:]   ### sentence going on in the next chunk
+    if carry:
+        yield carry
+
+def sentence_seedphrases(chunks, passcode_str='', effective_code_length=23, bit_wise_add=1):
+    seed_params(effective_code_length + 1)
+    cn_codes = CN_LIST.char_codes
+    sentences = ((sentence, sentence.translate(cn_codes)) for sentence in split_sentences(chunks))
+    sentences, sentences_in = itertools.tee((sentence, codes) for sentence, codes in sentences if codes)
+    results = generate_seedphrases_codes(((codes, passcode_str) for _, codes in sentences_in), effective_code_length, bit_wise_add)
+    for number, ((sentence, _), (cn_effective, en_idxs)) in enumerate(zip(sentences, results)):
+        yield number, sentence, cn_effective, en_idxs
+
+### file driver
+def main_corpus(in_path, out_path='', passcode_str='', mode='window', seed_length=24, bit_wise_add=1):
+    seed_params(seed_length)
+    if mode not in ('window', 'sentence'):
+        raise ValueError(f"Expecting mode window or sentence, not {mode}")
+    chunks = read_text(in_path)
+    with (open(out_path, 'w', encoding='utf-8') if out_path not in ('', '-') else contextlib.nullcontext(sys.stdout)) as fout:
+        if mode == 'window':
+            for number, cn_effective, en_idxs in window_seedphrases(chunks, passcode_str, seed_length - 1, bit_wise_add):
+                fout.write(json.dumps({'window': number, 'cn_effective': cn_effective, 'passphrase': ' '.join(EN_LIST[i] for i in en_idxs)}, ensure_ascii=False) + '\n')
+        else:
+            for number, cn_input, cn_effective, en_idxs in sentence_seedphrases(chunks, passcode_str, seed_length - 1, bit_wise_add):
+                fout.write(json.dumps({'sentence': number, 'cn_input': cn_input, 'cn_effective': cn_effective, 'passphrase': ' '.join(EN_LIST[i] for i in en_idxs)}, ensure_ascii=False) + '\n')
+
+def main():
+    args = (sys.argv[1:] + ['', '', '', '', '', ''])[:6]
+    in_path, out_path, passcode_str, mode, seed_length, bit_wise_add = args
+    if not in_path:
+        print(f"Usage: {sys.argv[0]} text.txt [output.jsonl|-] [passcode, default none] [window/sentence, default window] [seed length 12/15/18/21/24, default 24] [combining mode 0/1, default 1]")
+        sys.exit(1)
+    main_corpus(in_path, out_path, passcode_str.strip(), mode or 'window', int(seed_length) if seed_length else 24, int(bit_wise_add) if bit_wise_add else 1)
+
+if __name__ == "__main__":
+    main()
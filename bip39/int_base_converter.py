@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+import string
+
+from .wordlist import NO_OF_WORDS, CN_LIST, EN_LIST   ### CONSTANT LISTS - shared, verified by sha256 on first use
+
+### The I2C (index to char) dict is indexed from 1 to 2048 - to avoid 0 in the ordinals/indexes
+### built on first access only (module __getattr__), the converters below go through the Wordlist indexes
+_LAZY_DICTS = {
+    'EN_I2C_DICT' : lambda: dict([(i+1, EN_LIST[i]) for i in range(NO_OF_WORDS)]),
+    'EN_C2I_DICT' : lambda: dict([(EN_LIST[i], i+1) for i in range(NO_OF_WORDS)]),
+    'CN_I2C_DICT' : lambda: dict([(i+1, CN_LIST[i]) for i in range(NO_OF_WORDS)]),
+    'CN_C2I_DICT' : lambda: dict([(CN_LIST[i], i+1) for i in range(NO_OF_WORDS)]),
+}
+
+def __getattr__(name):
+    if name not in _LAZY_DICTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = _LAZY_DICTS[name]()
+    return value
+
+BASE2048_CHARS_CN = CN_LIST  # BIP39 range from 0 to 2047, .index() is a dict lookup
+BASE2048_CHARS_EN = EN_LIST  # BIP39 range from 0 to 2047, .index() is a dict lookup
+BASE2048 = len(BASE2048_CHARS_EN)
+
+# Base95 character set (printable ASCII characters)
+BASE95_CHARS = ''.join(chr(i) for i in range(32, 127))
+BASE95 = len(BASE95_CHARS)
+
+def int_to_base95(n):
+    """Convert an integer to a Base95 string."""
+    if n == 0:
+        return BASE95_CHARS[0]
+    
+    result = []
+    while n > 0:
+        result.append(BASE95_CHARS[n % BASE95])
+        n //= BASE95
+    return ''.join(reversed(result))
+
+def base95_to_int(s):
+    """Convert a Base95 string back to an integer."""
+    result = 0
+    for char in s:
+        result = result * BASE95 + BASE95_CHARS.index(char)
+    return result
+
+def int_to_base2048en(n):
+    """Convert an integer to a Base2048 string."""
+    if n == 0:
+        return BASE2048_CHARS_EN[0]
+
+    result = []
+    while n > 0:
+        result.append(BASE2048_CHARS_EN[n % BASE2048])
+        n //= BASE2048
+    return ' '.join(reversed(result))
+
+def base2048en_to_int(s):
+    """Convert a Base2048 string back to an integer."""
+    result = 0
+    for char in s.split(' '):
+        result = result * BASE2048 + BASE2048_CHARS_EN.index(char)
+    return result
+
+def int_to_base2048cn(n):
+    """Convert an integer to a Base2048 string."""
+    if n == 0:
+        return BASE2048_CHARS_CN[0]
+
+    result = []
+    while n > 0:
+        result.append(BASE2048_CHARS_CN[n % BASE2048])
+        n //= BASE2048
+    return ''.join(reversed(result))
+
+def base2048cn_to_int(s):
+    """Convert a Base2048 string back to an integer."""
+    result = 0
+    for char in s:
+        result = result * BASE2048 + BASE2048_CHARS_CN.index(char)
+    return result
+
+def main():
+    number = 1234567846489641354132132136516389684365135213212313219425534524365835253435
+    encoded95     = int_to_base95(number)
+    decoded95     = base95_to_int(encoded95)
+    encoded2048en = int_to_base2048en(number)
+    decoded2048en = base2048en_to_int(encoded2048en)
+    encoded2048cn = int_to_base2048cn(number)
+    decoded2048cn = base2048cn_to_int(encoded2048cn)
+
+    print(f"Original number:         \t: {number       }")
+    print(f"Encoded in Base95:len:{len(encoded95)}\t: {encoded95    }")
+    print(f"Decoded back to integer: \t: {decoded95    }")
+    print(f"Encoded in Base2048EN:len:{len(encoded2048en.split(' '))}\t: {encoded2048en}")
+    print(f"Decoded back to integer: \t: {decoded2048en}")
+    print(f"Encoded in Base2048CN:len:{len(encoded2048cn)}\t: {encoded2048cn}")
+    print(f"Decoded back to integer: \t: {decoded2048cn}")
+
+if __name__ == "__main__":
+    main()
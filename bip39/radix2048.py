@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### Radix-2048 codec: integer <-> base2048 digits (BIP39 word indexes), most significant digit first
+###
+### Replaces the recursive to2048 / from2048 lambdas, which were quadratic (a list concatenation per digit, fresh big-int
+### powers 2048**i) and hit the recursion limit on long inputs. 2048 is 2**11, so every 8 digits are exactly 88 bits
+### = 11 bytes: the integer is converted with a single int.to_bytes / int.from_bytes, and each 11 byte group is split into
+### (or built from) its 8 digits with shifts and masks on a small int - linear in the number of digits.
+
+RADIX_BITS = 11
+RADIX_MASK = (1 << RADIX_BITS) - 1   ### 2047
+
+_GROUP_DIGITS = 8    ### digits per group
+_GROUP_BYTES  = 11   ### bytes per group, 8 * 11 bits = 11 * 8 bits
+_GROUP_SHIFTS = tuple(RADIX_BITS * i for i in reversed(range(_GROUP_DIGITS)))   ### (77, 66, ... , 11, 0)
+
+def to2048(n, width=None):
+    ### n: non-negative integer
+    ### width None : as many digits as needed, no leading zeros - [] for 0, same as the old lambda
+    ### width      : exactly the last `width` digits (n mod 2048**width), padded with leading zeros
+    if width is None:
+        width = (n.bit_length() + RADIX_BITS - 1) // RADIX_BITS
+    elif n.bit_length() > RADIX_BITS * width:
+        n &= (1 << (RADIX_BITS * width)) - 1
+
+    groups = (width + _GROUP_DIGITS - 1) // _GROUP_DIGITS
+    data = n.to_bytes(groups * _GROUP_BYTES, 'big')
+
+    digits = []
+    for i in range(0, len(data), _GROUP_BYTES):
+        group = int.from_bytes(data[i:i + _GROUP_BYTES], 'big')
+        digits.extend([(group >> shift) & RADIX_MASK for shift in _GROUP_SHIFTS])
+    return digits[len(digits) - width:]
+
+def from2048(digits):
+    ### digits: base2048 digits (0 - 2047), most significant first -> integer
+    digits = list(digits)
+    digits[:0] = [0] * (-len(digits) % _GROUP_DIGITS)   ### pad to whole groups
+
+    data = bytearray()
+    for i in range(0, len(digits), _GROUP_DIGITS):
+        group = 0
+        for digit in digits[i:i + _GROUP_DIGITS]:
+            group = (group << RADIX_BITS) | digit
+        data += group.to_bytes(_GROUP_BYTES, 'big')
+    return int.from_bytes(data, 'big')
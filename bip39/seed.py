@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### BIP39 seed derivation - mnemonic -> 64 byte seed, PBKDF2-HMAC-SHA512 with 2048 iterations
+###
+### mnemonic_to_seed() takes a phrase as given by the generators - a string (genseed) or a list of words (the en_output
+### of generate_seedphrase) - and the optional BIP39 passphrase (not the passcode used to generate the phrase).
+### Both are NFKD normalized, the salt is 'mnemonic' + passphrase, as in the BIP39 spec.
+###
+### derive_seeds() is the batch stage: it lazily yields the seed of every phrase, in input order. The 2048 iterations
+### dominate the cost of a batch, and hashlib.pbkdf2_hmac releases the GIL while it runs, so the phrases are spread over
+### a thread pool by default (no pickling, no worker start up) - or a process pool, through the same bounded, ordered
+### pool as bip39.batch (imap_chunks_ordered).
+###
+### File driver - one phrase per line in, one json line per non blank line out:
+###   python bip39_seed.py phrases.txt [output.jsonl, default/- stdout] [passphrase, default none] [workers, default 0 for all cores] [thread/process, default thread]
+###   output : {"line": 1, "seed": "<128 hex digits>"}
+
+import sys
+import json
+import hashlib
+import itertools
+import contextlib
+import unicodedata
+
+from .batch import imap_chunks_ordered
+
+PBKDF2_ROUNDS = 2048
+SEED_BYTES = 64
+
+def mnemonic_to_seed(phrase, passphrase=''):
+    phrase = phrase if isinstance(phrase, str) else ' '.join(phrase)
+    phrase = unicodedata.normalize('NFKD', phrase)
+    salt = unicodedata.normalize('NFKD', 'mnemonic' + passphrase)
+    return hashlib.pbkdf2_hmac('sha512', phrase.encode('utf-8'), salt.encode('utf-8'), PBKDF2_ROUNDS)
+
+def _derive_chunk(phrases, passphrase):
+    return [mnemonic_to_seed(phrase, passphrase) for phrase in phrases]
+
+EXECUTORS = {   ### names in concurrent.futures, looked up when a pool is started
+    'thread'  : 'ThreadPoolExecutor',
+    'process' : 'ProcessPoolExecutor',
+}
+
+def derive_seeds(phrases, passphrase='', workers=None, executor='thread', chunksize=16):
+    ### workers: None/0 for all cores, 1 for serial in this thread
+    if workers == 1:
+        yield from (mnemonic_to_seed(phrase, passphrase) for phrase in phrases)
+    else:
+        import concurrent.futures
+        pool = getattr(concurrent.futures, EXECUTORS[executor])
+        yield from imap_chunks_ordered(_derive_chunk, phrases, (passphrase,), workers, chunksize, executor=pool)
+
+### file driver
+def main_seed(in_path, out_path='', passphrase='', workers=None, executor='thread'):
+    with open(in_path, 'r', encoding='utf-8') as fin, (open(out_path, 'w', encoding='utf-8') if out_path not in ('', '-') else contextlib.nullcontext(sys.stdout)) as fout:
+        lines_in, lines_out = itertools.tee((line_no, line.strip()) for line_no, line in enumerate(fin, 1) if line.strip())
+        seeds = derive_seeds((line for _, line in lines_in), passphrase, workers, executor)
+        for (line_no, _), seed in zip(lines_out, seeds):
+            fout.write(json.dumps({'line': line_no, 'seed': seed.hex()}) + '\n')
+
+def main():
+    args = (sys.argv[1:] + ['', '', '', '', ''])[:5]
+    in_path, out_path, passphrase, workers, executor = args
+    if not in_path:
+        print(f"Usage: {sys.argv[0]} phrases.txt [output|-] [passphrase, default none] [workers, default 0 for all cores] [thread/process, default thread]")
+        sys.exit(1)
+    main_seed(in_path, out_path, passphrase, int(workers) if workers else None, executor or 'thread')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### By James Zheng 19-Sep-2024
+###
+### Methodology:
+### 1. calculate SHA256 of the given passcode ( in utf-8 ) - if no passcode provided, the number will be set to 0
+### 2. convert input seedphrases into a 24 digit base2048 number
+### 3. add the step 1 and step 2 numbers
+### 4. convert step 3 results into english seedphrase - do a mod and take the remainder only
+
+### References:
+### below lists are sourced from : https://github.com/bitcoin/bips/tree/master/bip-0039
+### as of 8-Apr-2024
+
+import os
+import re
+import sys
+import hashlib
+import unicodedata
+from array import array
+
+from .wordlist import WORD_DICT, get_wordlist, split_chars   ### all ten BIP39 wordlists - each language is loaded and verified on first use
+from .checksum import seed_params, checksum_idxs
+
+
+LANG_DICT = {
+    0:"CHINESE_SIMPLIFIED",
+    1:"CHINESE_TRADITIONAL",
+    2:"CZECH",
+    3:"ENGLISH",
+    4:"FRENCH",
+    5:"ITALIAN",
+    6:"JAPANESE",
+    7:"KOREAN",
+    8:"PORTUGUESE",
+    9:"SPANISH",
+}
+
+SEED_LENGTH = 24   ### default length of the seed phrases, any of bip39.checksum.SEED_LENGTHS (12, 15, 18, 21, 24)
+
+### CONSTANT LISTS AND DICTS
+OUT_LIST = get_wordlist("ENGLISH")
+
+### helper functions to convert ascii passcode into a base2048 number using sha256
+from .radix2048 import to2048, from2048   ### linear base2048 codec, to2048(n, width) keeps the last width digits
+
+### no I/O: the steps are only explained when a trace list is given - the lines are added to it for the CLI to print
+def sha256_str2int(passcode_str, trace=None):
+    if passcode_str:
+        hex_str = hashlib.sha256(passcode_str.encode('utf-8')).hexdigest()
+        decimal_value = int(hex_str, 16)
+        if trace is not None:
+            trace.append(f'CODE: hashlib.sha256("{passcode_str}".encode("utf-8")).hexdigest() ==> for passcode_str: "{passcode_str}" is: "{hex_str}"')
+            trace.append(f'CODE: int("{hex_str}", 16) ==> for decimal value of the hex {hex_str} is : {decimal_value}')
+        return decimal_value 
+    else:
+        return 0
+
+### result of generate_seedphrase - only the indexes are stored (array('H'), 2 bytes each) with the language and the
+### distinct excluded words; the words, the numbered dict and the excluded set are built on access. Iterating gives the 7 values
+### generate_seedphrase used to return as a tuple, so existing tuple unpacking keeps working.
+class SeedPhrase(object):
+    __slots__ = ('language', 'source_excluded', '_source_idxs', '_en_idxs', '_last_idxs')
+
+    def __init__(self, language, source_excluded, source_idxs, en_idxs, last_idxs):
+        self.language = language
+        ### distinct excluded characters / words in the order typed - a pasted text keeps only its few distinct ones
+        self.source_excluded = ''.join(dict.fromkeys(source_excluded)) if isinstance(source_excluded, str) else tuple(dict.fromkeys(source_excluded))
+        self._source_idxs = array('H', source_idxs)
+        self._en_idxs = array('H', en_idxs)      ### before the checksum word
+        self._last_idxs = array('H', last_idxs)  ### every valid checksum word, the first one is used
+
+    @property
+    def source_char_excluded(self):
+        return set(self.source_excluded)
+
+    @property
+    def source_char_effective(self):
+        src_list = get_wordlist(self.language)
+        words = [src_list[i] for i in self._source_idxs]
+        return ''.join(words) if _is_chinese(self.language) else words   ### a string of characters for chinese, as before
+
+    @property
+    def source_idxs(self):
+        return self._source_idxs.tolist()
+
+    @property
+    def en_idxs(self):
+        return self._en_idxs.tolist()
+
+    @property
+    def en_output(self):
+        return [OUT_LIST[i] for i in self._en_idxs] + [OUT_LIST[self._last_idxs[0]]]
+
+    @property
+    def en_indexed_output(self):
+        return dict(enumerate(self.en_output, 1))
+
+    @property
+    def last_words(self):
+        return [OUT_LIST[i] for i in self._last_idxs]
+
+    def __iter__(self):
+        return iter((self.source_char_excluded, self.source_char_effective, self.source_idxs, self.en_idxs, self.en_output, self.en_indexed_output, self.last_words))
+
+### tokenizers - compiled once per language: source text -> (wordlist indexes of the known words in input order, the
+### excluded words as typed). Both are linear in the input, no per separator copies of the text
+SEPARATORS = '''`1234567890-=~!@#$%^&*()_+[]\\{}|;':",.<>/?'''   ### split words like white space does
+_SEPARATOR_TABLE = str.maketrans(SEPARATORS, ' ' * len(SEPARATORS))
+_TOKENIZERS = {}
+
+def _char_tokenizer(src_list):
+    ### chinese: one word per character, 2 str.translate passes (bip39.wordlist.split_chars)
+    def tokenize(source_input):
+        codes, excluded = split_chars(source_input, src_list)
+        return list(map(ord, codes)), excluded
+    return tokenize
+
+def _word_tokenizer(src_list):
+    ### NFKD like the wordlist files, so typed accents (french, spanish, czech) and japanese kana match; split() also
+    ### takes the ideographic space of japanese (NFKD turns it into a plain space anyway) and any run of separators
+    lookup = src_list.get
+    def tokenize(source_input):
+        words = unicodedata.normalize('NFKD', source_input.lower()).translate(_SEPARATOR_TABLE).split()
+        idxs = list(map(lookup, words))
+        return [i for i in idxs if i is not None], [w for w, i in zip(words, idxs) if i is None]
+    return tokenize
+
+def _is_chinese(language):
+    return language.upper().endswith('CHINESE') or language.upper().startswith('CHINESE')
+
+def get_tokenizer(language):
+    tokenizer = _TOKENIZERS.get(language)
+    if tokenizer is None:
+        src_list = get_wordlist(language)
+        tokenizer = _TOKENIZERS[language] = (_char_tokenizer if _is_chinese(language) else _word_tokenizer)(src_list)
+    return tokenizer
+
+### seedphrase generator
+def generate_seedphrase(language, source_input, int_value_to_add=0, seed_length=SEED_LENGTH):
+    try:
+        seed_params(seed_length)
+        effective_code_length = seed_length - 1   ### the last (checksum) word is generated, e.g. 24 -> 23
+        source_idxs, source_char_excluded = get_tokenizer(language)(source_input)
+        return _seedphrase(language, source_idxs, source_char_excluded, int_value_to_add, effective_code_length)
+
+    except Exception as e:
+        raise Exception(f"Error in generate_seedphrase: {e}")
+
+def _seedphrase(language, source_idxs, source_char_excluded, int_value_to_add, effective_code_length):
+    if not source_idxs:
+        source_idxs = [0] * effective_code_length   ### logic : if effective chinese string not available -> use first char, set idx to 0
+    source_idxs = source_idxs[:effective_code_length]
+    source_idxs = (source_idxs * -(-effective_code_length // len(source_idxs)))[:effective_code_length]   ### first words, repeated from the start if too short
+    source_char_value = from2048(source_idxs)
+    combined_value = source_char_value + int_value_to_add
+    en_idxs  = to2048(combined_value, effective_code_length)
+
+    ### generate the last checksum code - straight from the indexes, words are only produced on access (SeedPhrase)
+    return SeedPhrase(language, source_char_excluded, source_idxs, en_idxs, checksum_idxs(en_idxs))
+
+### streaming evaluation for text of any size (files, pasted essays) in bounded memory
+### Only the first effective_code_length words of the effective stream reach from2048 - the cut above - so the result
+### depends on that head, the passcode value and the set of excluded words; all 7 values of generate_seedphrase are
+### built from nothing else. The stream keeps the head and the distinct excluded words and drops every chunk once it is
+### tokenized. The chunks are tokenized as if they were one text:
+###   chinese : every character is looked up on its own, any cut gives the same characters
+###   words   : a chunk is cut after its last white space (ascii or the ideographic space of japanese) or separator that
+###             is neither cased nor case-ignorable. lower() and NFKD work per character except for the final sigma and
+###             combining marks: such a character ends the sigma context and is a starter, and it splits words, so
+###             split() of the pieces gives the words of the whole text. A chunk without one is cut after a case-ignorable
+###             separator (. : ' ^ `) between two letters that end the sigma context too (not case-ignorable, not Σ,
+###             starters), so a piece is never much longer than a chunk unless a single word is
+_CUT_CHARS = '\t\n\r\x0b\x0c\u3000' + ''.join(c for c in SEPARATORS if ('aΣ' + c + 'b').lower()[1] == 'ς')   ### the final sigma stays final: not case-ignorable
+_CUT_TABLE = str.maketrans(_CUT_CHARS, ' ' * len(_CUT_CHARS))
+_LOOSE_CUT = re.compile('(?<=[^\\W\\d_])[' + re.escape(''.join(c for c in SEPARATORS if c not in _CUT_CHARS)) + '](?=[^\\W\\d_])')
+
+def _ends_sigma_context(letter):
+    return letter != 'Σ' and unicodedata.category(letter) != 'Lm' and not unicodedata.combining(unicodedata.normalize('NFKD', letter)[0])
+
+def _loose_cut(chunk):
+    for match in reversed(list(_LOOSE_CUT.finditer(chunk))):
+        if _ends_sigma_context(chunk[match.start() - 1]) and _ends_sigma_context(chunk[match.end()]):
+            return match.end()
+    return 0
+
+def _word_pieces(chunks):
+    carry = []   ### text since the last cut, a word may go on in the next chunk
+    for chunk in chunks:
+        cut = chunk.translate(_CUT_TABLE).rfind(' ') + 1 or _loose_cut(chunk)
+        if cut:
+            yield ''.join(carry) + chunk[:cut]
+            carry = []
+        carry.append(chunk[cut:])
+    yield ''.join(carry)
+
+def generate_seedphrase_stream(language, chunks, int_value_to_add=0, seed_length=SEED_LENGTH):
+    ### chunks: any iterable of text, e.g. iter(functools.partial(f.read, 1 << 20), '') of a file opened as utf-8
+    ### same result as generate_seedphrase(language, ''.join(chunks), int_value_to_add, seed_length), the excluded
+    ### words are kept once each, in the order first seen
+    try:
+        seed_params(seed_length)
+        effective_code_length = seed_length - 1
+        tokenize = get_tokenizer(language)
+        head, excluded = [], {}
+        for piece in (chunks if _is_chinese(language) else _word_pieces(chunks)):
+            source_idxs, source_char_excluded = tokenize(piece)
+            if len(head) < effective_code_length:
+                head += source_idxs[:effective_code_length - len(head)]
+            excluded.update(dict.fromkeys(source_char_excluded))
+        excluded = ''.join(excluded) if _is_chinese(language) else tuple(excluded)   ### same types as generate_seedphrase
+        return _seedphrase(language, head, excluded, int_value_to_add, effective_code_length)
+
+    except Exception as e:
+        raise Exception(f"Error in generate_seedphrase_stream: {e}")
+
+### command line main function
+def main_cli(seed_length=SEED_LENGTH):
+    language_input = input(f'Please choose your preferred language to generate seed phrases (default Simplified Chinese -> 0): {LANG_DICT}\n===>')
+    language_input = language_input if language_input.isnumeric() else 0
+    language = LANG_DICT.get(int(language_input), LANG_DICT[0])
+    source_input = input(f'Please type in your {language} characters:\n===>')
+    passcode_str_raw = input(f'Please enter your pass code:\tE.g. 12354, or A1123xx$#@, etc. Case sensitive!\n===>')
+    passcode_str = passcode_str_raw.strip()
+
+    trace = []
+    passcode_hash_value = sha256_str2int(passcode_str, trace)
+    for line in trace:
+        print(line)
+    source_char_excluded, source_char_effective, source_idxs, en_idxs, en_output, en_indexed_output, last_words = generate_seedphrase(language, source_input, passcode_hash_value, seed_length)
+
+    out_idxs = [OUT_LIST.index(c) for c in en_output]
+    import base58   ### CLI output only - not imported by library users
+    passcode_hash_b58 = base58.b58encode_int(passcode_hash_value).decode('utf-8')
+    passcode_hash_b58f = [passcode_hash_b58[i*10:(i+1)*10]  for i in range(len(passcode_hash_b58)//10 + 1)]
+
+    print("#"*100)
+    if source_char_excluded:
+        print(f"{source_char_excluded} are not in the list of the 2048 {language} characters - Removed!!!")
+    print(f"Effective {language} input is:[len:{len(source_char_effective)}]: {' '.join(source_char_effective)}")
+    print(f"{language} indexes:\n\t{source_idxs}")
+    print(f"SHA256 value of passcode_str '{passcode_str}' is:\n\t{passcode_hash_value}")
+    print(f'Auto-generated checksum last_words are: "{last_words}. Taking the first one {last_words[0]}/{out_idxs[-1]}"')
+    print(f"Target English passphrase indexes:\n\t{out_idxs}")
+    print("#"*100)
+    print(f"Your passphrase [len:{len(en_output)}]:\n{' '.join(en_output)}\n{en_indexed_output}")
+    print(f"Suggested Passphrase: Passcode.SHA256.Base58: {passcode_hash_b58} => [ {' '.join(passcode_hash_b58f)} ]")
+
+
+def main():
+    ### python semaj_seed_phrase_generator.py [seed length: 12, 15, 18, 21 or 24, default 24]
+    main_cli(int(sys.argv[1]) if sys.argv[1:] else SEED_LENGTH)
+
+if __name__ == "__main__":
+    main()
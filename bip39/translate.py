@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### BIP39 mnemonic translation between any two of the ten languages
+###
+### A BIP39 phrase is its word indexes - the same indexes in another language's wordlist is the same phrase (same
+### entropy, same checksum). translation_matrix() is the one 10 x 2048 table of every word, row = language (LANGUAGES
+### order), column = word index, built once on first use; a phrase is parsed into indexes once (bip39.validate) and
+### every target language is a row lookup per index - no per pair dicts such as cn_en_dict.
+###
+### translate_phrases() streams phrases into one or more target languages in a single pass:
+###   python bip39_translate.py phrases.txt [output.jsonl, default/- stdout] [from language, default AUTO] [to languages, comma separated, default ENGLISH]
+###   output : {"line": 1, "language": "CHINESE_SIMPLIFIED", "ENGLISH": "...", ...} or "unknown_words": [...] if a word is not in the list
+
+import sys
+import json
+import itertools
+import contextlib
+
+from .wordlist import LANGUAGES, get_wordlist
+from .validate import phrase2idxs, detect_language, join_phrase
+
+LANGUAGE_NO = {language: i for i, language in enumerate(LANGUAGES)}   ### language -> row of the matrix
+
+_MATRIX = []
+
+def translation_matrix():
+    if not _MATRIX:
+        _MATRIX.extend(get_wordlist(language) for language in LANGUAGES)
+    return _MATRIX
+
+def translate_idxs(idxs, to_language):
+    row = translation_matrix()[LANGUAGE_NO[to_language.upper()]]
+    return [row[i] for i in idxs]
+
+def translate_phrase(phrase, from_language='AUTO', to_languages=('ENGLISH',)):
+    ### -> (source language, [the phrase in each of to_languages], unknown words) - the translations are None if any word is unknown
+    from_language = from_language.upper()
+    if from_language == 'AUTO':
+        from_language, idxs, unknown_words = detect_language(phrase)
+    else:
+        idxs, unknown_words = phrase2idxs(phrase, from_language)
+    if unknown_words:
+        return from_language, None, tuple(unknown_words)
+    return from_language, [join_phrase(translate_idxs(idxs, language), language.upper()) for language in to_languages], ()
+
+def translate_phrases(phrases, from_language='AUTO', to_languages=('ENGLISH',)):
+    translation_matrix()   ### every row loaded up front, not on the first phrase of each language
+    for phrase in phrases:
+        yield translate_phrase(phrase, from_language, to_languages)
+
+### file driver
+def main_translate(in_path, out_path='', from_language='AUTO', to_languages=('ENGLISH',)):
+    to_languages = [language.upper() for language in to_languages]
+    for language in to_languages + ([] if from_language.upper() == 'AUTO' else [from_language.upper()]):
+        if language not in LANGUAGE_NO:
+            raise ValueError(f"Unknown BIP39 language {language}, expecting one of {LANGUAGES}")
+
+    with open(in_path, 'r', encoding='utf-8') as fin, (open(out_path, 'w', encoding='utf-8') if out_path not in ('', '-') else contextlib.nullcontext(sys.stdout)) as fout:
+        lines_in, lines_out = itertools.tee((line_no, line) for line_no, line in enumerate(fin, 1) if line.strip())
+        results = translate_phrases((line for _, line in lines_in), from_language, to_languages)
+        for (line_no, _), (language, translations, unknown_words) in zip(lines_out, results):
+            record = {'line': line_no, 'language': language}
+            if unknown_words:
+                record['unknown_words'] = list(unknown_words)
+            else:
+                record.update(zip(to_languages, translations))
+            fout.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+def main():
+    args = (sys.argv[1:] + ['', '', '', ''])[:4]
+    in_path, out_path, from_language, to_languages = args
+    if not in_path:
+        print(f"Usage: {sys.argv[0]} phrases.txt [output|-] [from language, default AUTO] [to languages, comma separated, default ENGLISH]")
+        sys.exit(1)
+    main_translate(in_path, out_path, from_language or 'AUTO', to_languages.split(',') if to_languages else ('ENGLISH',))
+
+if __name__ == "__main__":
+    main()
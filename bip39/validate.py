@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### BIP39 mnemonic validation and checksum repair
+###
+### validate_phrases() takes an iterable of mnemonics (one phrase per string, words separated by any white space,
+### chinese phrases may also be written without spaces) and lazily yields one compact result per phrase:
+###   (status, language, unknown words, word indexes of the repaired phrase or None)
+### status:
+###   valid         : every word is in the wordlist and the checksum word matches
+###   bad_checksum  : every word is known, the checksum word does not match
+###   unknown_words : some words are not in the wordlist (listed in the result)
+###   bad_length    : not 12, 15, 18, 21 or 24 words
+### Phrases are NFKD normalized like the wordlist files, turned into word indexes once, and checked on the indexes.
+### language AUTO picks, per phrase, the first language knowing every word (or the most words).
+### With repair, a bad checksum phrase also gets its repaired indexes: the last word keeps its entropy bits and gets the
+### checksum bits recomputed - for our own phrases (first checksum candidate) that is the word the generators give.
+###
+### validate_phrases_parallel() gives the same results in the same order from a process pool (bip39.batch ordered pool).
+###
+### File driver - one phrase per line in, one json line per non blank line out:
+###   python bip39_validate.py phrases.txt [output.jsonl, default/- stdout] [language, default ENGLISH, or AUTO] [repair 0/1, default 0] [processes, default 1, 0 for all cores]
+###   output : {"line": 1, "status": "valid", "language": "ENGLISH"} + "unknown_words": [...] / "repaired": "..." when set
+
+import sys
+import json
+import itertools
+import contextlib
+import unicodedata
+
+from .wordlist import LANGUAGES, get_wordlist
+from .checksum import SEED_PARAMS, expected_checksum_idx
+from .batch import imap_chunks_ordered
+
+def split_phrase(phrase, language):
+    phrase = unicodedata.normalize('NFKD', phrase)
+    if language.startswith('CHINESE'):
+        return [c for c in phrase if not c.isspace()]   ### one character per word, with or without spaces
+    return phrase.split()   ### any white space, incl. the ideographic space of japanese phrases
+
+def join_phrase(words, language):
+    return ('\u3000' if language == 'JAPANESE' else ' ').join(words)
+
+def phrase2idxs(phrase, language):
+    ### -> (word indexes, None for an unknown word; the unknown words)
+    wordlist = get_wordlist(language)
+    words = split_phrase(phrase, language)
+    idxs = [wordlist.get(w) for w in words]
+    return idxs, [w for w, i in zip(words, idxs) if i is None]
+
+def detect_language(phrase):
+    ### -> (language, word indexes, unknown words) for the first language knowing every word, or the most words
+    candidates = ((language, *phrase2idxs(phrase, language)) for language in LANGUAGES)
+    return min(candidates, key=lambda candidate: len(candidate[2]))
+
+def validate_phrase(phrase, language='ENGLISH', repair=False):
+    language = language.upper()
+    if language == 'AUTO':
+        language, idxs, unknown_words = detect_language(phrase)
+    else:
+        idxs, unknown_words = phrase2idxs(phrase, language)
+
+    if unknown_words:
+        return 'unknown_words', language, tuple(unknown_words), None
+    if len(idxs) not in SEED_PARAMS:
+        return 'bad_length', language, (), None
+    last_idx = expected_checksum_idx(idxs)
+    if last_idx == idxs[-1]:
+        return 'valid', language, (), None
+    return 'bad_checksum', language, (), (tuple(idxs[:-1]) + (last_idx,) if repair else None)
+
+def validate_phrases(phrases, language='ENGLISH', repair=False):
+    for phrase in phrases:
+        yield validate_phrase(phrase, language, repair)
+
+def _init_worker(language):
+    ### warm worker: load and index the wordlist(s) once per process
+    for lang in (LANGUAGES if language.upper() == 'AUTO' else (language,)):
+        get_wordlist(lang)
+
+def validate_phrases_parallel(phrases, language='ENGLISH', repair=False, processes=None, chunksize=2048):
+    yield from imap_chunks_ordered(validate_phrases, phrases, (language, repair), processes, chunksize, _init_worker, (language,))
+
+### file driver
+def main_validate(in_path, out_path='', language='ENGLISH', repair=False, processes=1):
+    with open(in_path, 'r', encoding='utf-8') as fin, (open(out_path, 'w', encoding='utf-8') if out_path not in ('', '-') else contextlib.nullcontext(sys.stdout)) as fout:
+        lines_in, lines_out = itertools.tee((line_no, line) for line_no, line in enumerate(fin, 1) if line.strip())
+        phrases = (line for _, line in lines_in)
+
+        if processes == 1:
+            results = validate_phrases(phrases, language, repair)
+        else:
+            results = validate_phrases_parallel(phrases, language, repair, processes or None)
+
+        for (line_no, _), (status, lang, unknown_words, repaired) in zip(lines_out, results):
+            record = {'line': line_no, 'status': status, 'language': lang}
+            if unknown_words:
+                record['unknown_words'] = list(unknown_words)
+            if repaired:
+                record['repaired'] = join_phrase((get_wordlist(lang)[i] for i in repaired), lang)
+            fout.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+def main():
+    args = (sys.argv[1:] + ['', '', '', '', ''])[:5]
+    in_path, out_path, language, repair, processes = args
+    if not in_path:
+        print(f"Usage: {sys.argv[0]} phrases.txt [output|-] [language, default ENGLISH, or AUTO] [repair 0/1, default 0] [processes, default 1, 0 for all cores]")
+        sys.exit(1)
+    main_validate(in_path, out_path, language or 'ENGLISH', bool(int(repair)) if repair else False, int(processes) if processes else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### NumPy batch versions of the index level steps, on (N, words) uint16 index matrices - one row per phrase
+###
+### combine_idxs_array() is combine_idxs() of bip39.cn2en_v3 for a whole batch, in both combining modes:
+###   bit-wise mode : one modular add over the whole matrix
+###   add-up mode   : radix-2048 addition of the two numbers, the carry is propagated column by column (right to left)
+###                   over all rows at once, so the cost is L vector ops instead of one big-int conversion per phrase
+###
+### entropy2idxs_array() / idxs2entropy_array() are the batch codec between raw entropy bytes and 11 bit word indexes:
+### (N, B) uint8 entropy + checksum bits <-> (N, words) uint16 indexes, e.g. (N, 32) <-> (N, 24). Word j starts at bit
+### 11 * j, so it always sits in the 3 bytes from byte 11 * j // 8: each column is gathered from (or scattered into) those
+### bytes with one shift and mask per column, precomputed per length (_WORD_BYTES) - no per bit matrix, no per phrase ints.
+### Only the sha256 of each row is left per row, hashlib has no batch interface.
+###
+### numpy is only needed when this module is used.
+
+import hashlib
+
+import numpy as np
+
+from .radix2048 import RADIX_BITS, RADIX_MASK
+from .checksum import ENTROPY_PARAMS, seed_params
+
+def combine_idxs_array(cn_idxs, passcode_digits, bit_wise_add):
+    ### cn_idxs         : (N, L) uint16, chinese indexes of each phrase
+    ### passcode_digits : (N, 24) uint16, base2048 digits of each passcode's sha256, most significant first (all 0: no passcode)
+    ### returns the (N, L) uint16 english indexes before the checksum word - row by row the same as combine_idxs()
+    cn_idxs = np.asarray(cn_idxs, dtype=np.uint16)
+    passcode_digits = np.asarray(passcode_digits, dtype=np.uint16)
+    rows, length = cn_idxs.shape
+
+    if bit_wise_add:
+        if length > passcode_digits.shape[1]:
+            raise ValueError(f'Expecting at most {passcode_digits.shape[1]} words for the bit-wise mode, not {length}')
+        passcode = passcode_digits[:, ::-1][:, :length]   ### reversed, the smallest digit first - as passcode_to_base_2048(p, True)
+        return (cn_idxs + passcode) & RADIX_MASK           ### c = (x + p) mod 2048, at most 4094 - no uint16 overflow
+
+    ### add-up mode: (cn value + passcode value) mod 2048**L, as a digit-wise sum with carry
+    passcode = np.zeros((rows, length), dtype=np.uint16)
+    overlap = min(length, passcode_digits.shape[1])
+    if overlap:
+        passcode[:, length - overlap:] = passcode_digits[:, passcode_digits.shape[1] - overlap:]
+    digit_sums = cn_idxs + passcode
+
+    en_idxs = np.empty((rows, length), dtype=np.uint16)
+    carry = np.zeros(rows, dtype=np.uint16)
+    for column in range(length - 1, -1, -1):
+        column_sum = digit_sums[:, column] + carry
+        en_idxs[:, column] = column_sum & RADIX_MASK
+        carry = column_sum >> RADIX_BITS
+    return en_idxs
+
+### words -> (first byte of each word, right shift of each word in its 3 byte window), e.g. word 1 of any length: byte 1,
+### shift 10 (bits 11 - 21 of the phrase are bits 3 - 13 of bytes 1 - 3)
+_WORD_BYTES = {words: (np.array([RADIX_BITS * j // 8 for j in range(words)]),
+                       np.array([24 - RADIX_BITS - RADIX_BITS * j % 8 for j in range(words)], dtype=np.uint32))
+               for words, _ in ENTROPY_PARAMS.values()}
+
+def _first_hash_bytes(entropy):
+    return np.fromiter((hashlib.sha256(row).digest()[0] for row in entropy), dtype=np.uint8, count=len(entropy))
+
+def entropy2idxs_array(entropy, checksums=None):
+    ### entropy   : (N, B) uint8 raw entropy, B = 16, 20, 24, 28 or 32 bytes for 12 - 24 words
+    ### checksums : (N,) the B/4 checksum bits of each row (first bits of its sha256) - computed here if None
+    ### returns the (N, words) uint16 word indexes, the last one being the checksum word
+    entropy = np.ascontiguousarray(entropy, dtype=np.uint8)
+    rows, nbytes = entropy.shape
+    if nbytes not in ENTROPY_PARAMS:
+        raise ValueError(f'Expecting {", ".join(map(str, ENTROPY_PARAMS))} bytes of entropy, not {nbytes}')
+    words, checksum_bits = ENTROPY_PARAMS[nbytes]
+    if checksums is None:
+        checksums = _first_hash_bytes(entropy) >> (8 - checksum_bits)
+
+    data = np.zeros((rows, nbytes + 3), dtype=np.uint8)   ### entropy, checksum bits left aligned, 2 bytes of padding
+    data[:, :nbytes] = entropy
+    data[:, nbytes] = np.asarray(checksums, dtype=np.uint8) << (8 - checksum_bits)
+
+    offsets, shifts = _WORD_BYTES[words]
+    window = data[:, offsets].astype(np.uint32) << 16 | data[:, offsets + 1].astype(np.uint32) << 8 | data[:, offsets + 2]
+    return ((window >> shifts) & RADIX_MASK).astype(np.uint16)
+
+def idxs2entropy_array(idxs):
+    ### idxs: (N, words) word indexes including the checksum word, words = 12, 15, 18, 21 or 24
+    ### returns ((N, B) uint8 raw entropy, (N,) uint8 checksum bits carried by the last word)
+    idxs = np.asarray(idxs, dtype=np.uint16)
+    rows, words = idxs.shape
+    _, checksum_bits, nbytes = seed_params(words)
+
+    data = np.zeros((rows, nbytes + 3), dtype=np.uint8)
+    for word, offset, shift in zip(idxs.T, *_WORD_BYTES[words]):   ### the words do not overlap, or-ing them in is exact
+        window = word.astype(np.uint32) << shift
+        data[:, offset] |= (window >> 16).astype(np.uint8)
+        data[:, offset + 1] |= (window >> 8 & 0xff).astype(np.uint8)
+        data[:, offset + 2] |= (window & 0xff).astype(np.uint8)
+    return data[:, :nbytes].copy(), data[:, nbytes] >> (8 - checksum_bits)
+
+def checksum_idxs_array(idxs):
+    ### idxs: (N, L) word indexes before the checksum word -> (N,) index of the first valid checksum word of each row,
+    ### row by row the same as bip39.checksum.checksum_idx()
+    idxs = np.asarray(idxs, dtype=np.uint16)
+    rows, length = idxs.shape
+    checksum_bits = seed_params(length + 1)[1]
+    phrases = np.zeros((rows, length + 1), dtype=np.uint16)   ### first candidate: the entropy bits of the last word are 0
+    phrases[:, :length] = idxs
+    entropy, _ = idxs2entropy_array(phrases)
+    return (_first_hash_bytes(entropy) >> (8 - checksum_bits)).astype(np.uint16)
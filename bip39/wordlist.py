@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### Shared BIP39 wordlists - the one copy used by every script in this repo
+###
+### References:
+### below lists are sourced from : https://github.com/bitcoin/bips/tree/master/bip-0039
+### as of 8-Apr-2024
+###
+### The lists are stored as the upstream files in bip39/wordlists/<language>.txt (one word per line, utf-8). A language is only
+### read the first time it is asked for: the file is memory-mapped, checked against its stored sha256 digest (the same
+### digest as the upstream file) and split once - checking the digest replaces re-counting the words and rebuilding dicts
+### to make sure every list still has exactly 2048 words. A worker using a single language never pays for the other nine.
+
+import os
+import mmap
+import hashlib
+import collections.abc
+
+NO_OF_WORDS = 2048
+
+WORDLIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wordlists')
+
+WORDLIST_SHA256 = {
+    'CHINESE_SIMPLIFIED' : '5c5942792bd8340cb8b27cd592f1015edf56a8c5b26276ee18a482428e7c5726',
+    'CHINESE_TRADITIONAL' : '417b26b3d8500a4ae3d59717d7011952db6fc2fb84b807f3f94ac734e89c1b5f',
+    'CZECH' : '7e80e161c3e93d9554c2efb78d4e3cebf8fc727e9c52e03b83b94406bdcc95fc',
+    'ENGLISH' : '2f5eed53a4727b4bf8880d8f3f199efc90e58503646d9ff8eff3a2ed3b24dbda',
+    'FRENCH' : 'ebc3959ab7801a1df6bac4fa7d970652f1df76b683cd2f4003c941c63d517e59',
+    'ITALIAN' : 'd392c49fdb700a24cd1fceb237c1f65dcc128f6b34a8aacb58b59384b5c648c2',
+    'JAPANESE' : '2eed0aef492291e061633d7ad8117f1a2b03eb80a29d0e4e3117ac2528d05ffd',
+    'KOREAN' : '9e95f86c167de88f450f0aaf89e87f6624a57f973c67b516e338e8e8b8897f60',
+    'PORTUGUESE' : '2685e9c194c82ae67e10ba59d9ea5345a23dc093e92276fc5361f6667d79cd3f',
+    'SPANISH' : '46846a5a0139d1e3cb77293e521c2865f7bcdb82c44e8d0a06a2cd0ecba48c0b',
+}
+
+LANGUAGES = tuple(WORDLIST_SHA256)
+
+class Wordlist(tuple):
+    ### immutable index layer over one wordlist, shared by every lookup in the generators:
+    ###   wordlist[i] (index -> word), wordlist.index(word) (word -> index), word in wordlist (membership)
+    ### the last two go through a dict built once per list, instead of scanning up to 2048 words on every call
+    def __new__(cls, words):
+        self = super().__new__(cls, words)
+        self._word2idx = dict(zip(self, range(len(self))))
+        return self
+
+    def __reduce__(self):
+        return (Wordlist, (tuple(self),))
+
+    def __contains__(self, word):
+        return word in self._word2idx
+
+    def index(self, word):
+        try:
+            return self._word2idx[word]
+        except KeyError:
+            raise ValueError(f"{word!r} is not in the wordlist") from None
+
+    def get(self, word, default=None):
+        return self._word2idx.get(word, default)
+
+    ### str.translate tables for the lists of single characters (the Chinese ones), built on first use
+    ###   char_codes : wordlist character -> chr(index), any other character deleted
+    ###   char_drops : wordlist character deleted, any other character kept
+    ### the Wordlist itself is the table back: codes.translate(wordlist) maps chr(index) -> wordlist[index]
+    @property
+    def char_codes(self):
+        table = self.__dict__.get('_char_codes')
+        if table is None:
+            table = self._char_codes = _DeleteMissing((ord(c), i) for c, i in self._word2idx.items())
+        return table
+
+    @property
+    def char_drops(self):
+        table = self.__dict__.get('_char_drops')
+        if table is None:
+            table = self._char_drops = dict.fromkeys(map(ord, self))
+        return table
+
+class _DeleteMissing(dict):
+    ### str.translate deletes a character whose lookup gives None - the first miss of each character is stored, so the
+    ### same punctuation / latin text seen again stays a plain dict hit
+    def __missing__(self, codepoint):
+        self[codepoint] = None
+        return None
+
+def split_chars(text, wordlist):
+    ### one C level str.translate pass each, no per character python loop:
+    ### (the wordlist characters of text as codes chr(index), the other characters as typed)
+    return text.translate(wordlist.char_codes), text.translate(wordlist.char_drops)
+
+def repeat_codes(codes, length):
+    ### exactly `length` codes: cut if longer, repeated from the start if shorter, chr(0) (the first word) if empty
+    if not codes:
+        return '\0' * length
+    return codes[:length] if len(codes) >= length else (codes * -(-length // len(codes)))[:length]
+
+### lazy registry: language -> Wordlist of 2048 words, filled on first use
+_WORDLISTS = {}
+
+def _load_wordlist(language):
+    if language not in WORDLIST_SHA256:
+        raise ValueError(f"Unknown BIP39 language {language}, expecting one of {LANGUAGES}")
+
+    with open(os.path.join(WORDLIST_DIR, f'{language.lower()}.txt'), 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if hashlib.sha256(data).hexdigest() != WORDLIST_SHA256[language]:
+            raise Exception(f"The {language} wordlist does not match its stored sha256 digest, it should be the exact 2048 BIP39 words!, please check the code!!!")
+        with memoryview(data) as view:
+            return Wordlist(str(view, 'utf-8').split('\n')[:NO_OF_WORDS])
+
+def get_wordlist(language):
+    language = language.upper()
+    wordlist = _WORDLISTS.get(language)
+    if wordlist is None:
+        wordlist = _WORDLISTS[language] = _load_wordlist(language)
+    return wordlist
+
+class _WordDict(collections.abc.Mapping):
+    ### WORD_DICT['<LANGUAGE>_LIST'] as before - the same ten keys for len / in / keys / items / get / iteration - but
+    ### each list is only loaded when its value is asked for (get_wordlist keeps it)
+    def __getitem__(self, key):
+        if not (isinstance(key, str) and key.endswith('_LIST') and key[:-len('_LIST')] in LANGUAGES):
+            raise KeyError(key)
+        return get_wordlist(key[:-len('_LIST')])
+
+    def __contains__(self, key):
+        return isinstance(key, str) and key.endswith('_LIST') and key[:-len('_LIST')] in LANGUAGES
+
+    def __iter__(self):
+        return (f'{language}_LIST' for language in LANGUAGES)
+
+    def __len__(self):
+        return len(LANGUAGES)
+
+WORD_DICT = _WordDict()
+
+### CONSTANT LISTS AND DICTS - built once on first access, shared by every importer
+_LAZY_CONSTANTS = {
+    'CN_LIST'    : lambda: get_wordlist('CHINESE_SIMPLIFIED'),
+    'EN_LIST'    : lambda: get_wordlist('ENGLISH'),
+    'EN2CN_DICT' : lambda: dict(zip(get_wordlist('ENGLISH'), get_wordlist('CHINESE_SIMPLIFIED'))),
+    'CN2EN_DICT' : lambda: dict(zip(get_wordlist('CHINESE_SIMPLIFIED'), get_wordlist('ENGLISH'))),
+}
+
+def __getattr__(name):
+    if name not in _LAZY_CONSTANTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = _LAZY_CONSTANTS[name]()
+    return value
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### Benchmarks - the code lives in bip39/benchmark.py
+from bip39.benchmark import *
+from bip39.benchmark import main
+from bip39 import benchmark as _module
+
+def __getattr__(name):
+    ### names built on first access (e.g. the lazy dicts) are not copied by import *, look them up in the module
+    return getattr(_module, name)
+
+if __name__ == "__main__": main()
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### Seed phrases for every window / sentence of a large chinese text - the code lives in bip39/corpus.py
+from bip39.corpus import *
+from bip39.corpus import main
+from bip39 import corpus as _module
+
+def __getattr__(name):
+    ### names built on first access (e.g. the lazy dicts) are not copied by import *, look them up in the module
+    return getattr(_module, name)
+
+if __name__ == "__main__": main()
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### BIP39 seed derivation (PBKDF2-HMAC-SHA512) - the code lives in bip39/seed.py
+from bip39.seed import *
+from bip39.seed import main
+from bip39 import seed as _module
+
+def __getattr__(name):
+    ### names built on first access (e.g. the lazy dicts) are not copied by import *, look them up in the module
+    return getattr(_module, name)
+
+if __name__ == "__main__": main()
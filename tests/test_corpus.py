@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### bip39.corpus against bip39.cn2en_v3.generate_seedphrase: every window / sentence of random texts, cut into random
+### chunks, must give the words generate_seedphrase gives for its characters, and the sentences must not depend on
+### where the chunks (the read_text blocks) end
+###
+###   python -m pytest tests
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bip39.wordlist import CN_LIST, EN_LIST
+from bip39.cn2en_v3 import generate_seedphrase
+from bip39.corpus import read_text, split_sentences, window_seedphrases, sentence_seedphrases
+
+POOL = list(CN_LIST) + list('，。！？；!?;\n abc1')
+
+def random_text(rnd, k):
+    ### terminators are frequent enough to come in runs, also across chunk ends
+    return ''.join(rnd.choices(rnd.choices(POOL, k=12) + list('。。！\n'), k=rnd.randrange(0, k)))
+
+def random_chunks(rnd, text):
+    cuts = sorted(rnd.sample(range(len(text) + 1), min(len(text) + 1, rnd.randrange(1, 12))))
+    return [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+def test_windows_match_generate_seedphrase():
+    rnd = random.Random(0)
+    for n in range(200):
+        text = random_text(rnd, 120)
+        effective_code_length, passcode_str, bit_wise_add = rnd.choice((11, 14, 17, 20, 23)), rnd.choice(('', str(n))), n % 2
+        cn_chars = [c for c in text if c in CN_LIST]
+        windows = list(window_seedphrases(random_chunks(rnd, text), passcode_str, effective_code_length, bit_wise_add))
+        assert [number for number, _, _ in windows] == list(range(max(0, len(cn_chars) - effective_code_length + 1)))
+        for number, cn_effective, en_idxs in windows:
+            assert cn_effective == ''.join(cn_chars[number:number + effective_code_length])
+            seed_phrase = generate_seedphrase(effective_code_length, cn_effective, passcode_str, bit_wise_add)
+            assert [EN_LIST[i] for i in en_idxs] == seed_phrase.en_output, (text, effective_code_length, passcode_str, bit_wise_add)
+
+def test_sentences_do_not_depend_on_chunks():
+    assert list(split_sentences(['我们。', '。他们'])) == list(split_sentences(['我们。。他们'])) == ['我们。。', '他们']
+    rnd = random.Random(1)
+    for _ in range(500):
+        text = random_text(rnd, 200)
+        sentences = list(split_sentences([text]))
+        assert ''.join(sentences) == text
+        assert list(split_sentences(random_chunks(rnd, text))) == sentences, text
+
+def test_sentences_match_generate_seedphrase():
+    rnd = random.Random(2)
+    for n in range(200):
+        text = random_text(rnd, 200)
+        effective_code_length, passcode_str, bit_wise_add = rnd.choice((11, 14, 17, 20, 23)), rnd.choice(('', str(n))), n % 2
+        expected = [sentence for sentence in split_sentences([text]) if any(c in CN_LIST for c in sentence)]
+        results = list(sentence_seedphrases(random_chunks(rnd, text), passcode_str, effective_code_length, bit_wise_add))
+        assert [cn_input for _, cn_input, _, _ in results] == expected, text
+        for number, (sentence_no, cn_input, cn_effective, en_idxs) in enumerate(results):
+            seed_phrase = generate_seedphrase(effective_code_length, cn_input, passcode_str, bit_wise_add)
+            assert sentence_no == number
+            assert cn_effective == seed_phrase.cn_char_effective
+            assert [EN_LIST[i] for i in en_idxs] == seed_phrase.en_output
+
+def test_read_text_blocks(tmp_path):
+    ### blocks of a few bytes cut most characters (3 bytes in utf-8) in the middle
+    rnd = random.Random(3)
+    text = random_text(rnd, 2000)
+    path = tmp_path / 'text.txt'
+    path.write_text(text, encoding='utf-8')
+    for block_size in (1, 2, 5, 64, 1 << 20):
+        assert ''.join(read_text(str(path), block_size)) == text
+    (tmp_path / 'empty.txt').write_bytes(b'')
+    assert list(read_text(str(tmp_path / 'empty.txt'))) == []
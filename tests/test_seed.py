@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### bip39.seed: mnemonic_to_seed pinned to published BIP39 test vectors (the TREZOR vectors of the spec, passphrase
+### "TREZOR", and the first japanese vector of bip32JP), and derive_seeds giving the same seeds in the same order
+### serially, on the thread pool and on the process pool
+###
+###   python -m pytest tests
+
+import os
+import sys
+import random
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bip39.wordlist import get_wordlist
+from bip39.seed import mnemonic_to_seed, derive_seeds
+
+VECTORS = (   ### (phrase, passphrase, seed)
+    ('abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about', 'TREZOR',
+     'c55257c360c07c72029aebc1b53c05ed0362ada38ead3e3e9efa3708e53495531f09a6987599d18264c1e1c92f2cf141630c7a3c4ab7c81b2f001698e7463b04'),
+    ('legal winner thank year wave sausage worth useful legal winner thank yellow', 'TREZOR',
+     '2e8905819b8723fe2c1d161860e5ee1830318dbf49a83bd451cfb8440c28bd6fa457fe1296106559a3c80937a1c1069be3a3a5bd381ee6260e8d9739fce1f607'),
+    ('zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo vote', 'TREZOR',
+     'dd48c104698c30cfe2b6142103248622fb7bb0ff692eebb00089b32d22484e1613912f0a5b694407be899ffd31ed3992c456cdf60f5d4564b8ba3f05a69890ad'),
+    ('\u3000'.join(['あいこくしん'] * 11 + ['あおぞら']), '㍍ガバヴァぱばぐゞちぢ十人十色',
+     'a262d6fb6122ecf45be09c50492b31f92e9beb7d9a845987a02cefda57a15f9c467a17872029a9e92299b5cbdf306e3a0ee620245cbd508959b6cb7ca637bd55'),
+)
+
+def test_vectors():
+    for phrase, passphrase, seed in VECTORS:
+        assert mnemonic_to_seed(phrase, passphrase).hex() == seed
+        ### composed (NFC) input is normalized like the spec asks
+        assert mnemonic_to_seed(unicodedata.normalize('NFC', phrase), unicodedata.normalize('NFC', passphrase)).hex() == seed
+
+def test_list_of_words():
+    phrase, passphrase, seed = VECTORS[0]
+    assert mnemonic_to_seed(phrase.split(), passphrase).hex() == seed
+
+def test_derive_seeds_same_order():
+    rnd = random.Random(0)
+    words = get_wordlist('ENGLISH')
+    phrases = [' '.join(rnd.choices(words, k=rnd.choice((12, 24)))) for _ in range(100)]
+    serial = list(derive_seeds(phrases, 'TREZOR', workers=1))
+    assert serial == [mnemonic_to_seed(phrase, 'TREZOR') for phrase in phrases]
+    assert list(derive_seeds(iter(phrases), 'TREZOR', workers=3, chunksize=7)) == serial
+    assert list(derive_seeds(iter(phrases), 'TREZOR', workers=2, executor='process', chunksize=7)) == serial
+    assert list(derive_seeds([], 'TREZOR', workers=2)) == []
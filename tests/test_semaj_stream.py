@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### bip39.semaj generate_seedphrase / generate_seedphrase_stream against the implementation they replaced
+###
+### The oracle below is the original generate_seedphrase: the per separator replace loop, the double space passes, list
+### membership, the recursive to2048 / from2048 lambdas and the to_bytes checksum scan. Nothing of bip39.semaj,
+### bip39.radix2048 or bip39.checksum is used by it, so a change in the shared code (_seedphrase, the tokenizers, the
+### codec) has to agree with the old code, not with itself.
+###
+### The texts only use what both tokenizers split the same way: list words, ascii separators and plain spaces. Two
+### differences are intended and applied to the oracle's result: a run of separators no longer leaves an empty word
+### among the excluded words (the old split(' ') did), and the chinese effective input without any wordlist character
+### is a str like any other chinese effective input, no longer a list.
+###
+###   python -m pytest tests
+
+import os
+import sys
+import random
+import hashlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bip39.wordlist import get_wordlist
+from bip39.semaj import LANG_DICT, generate_seedphrase, generate_seedphrase_stream, _word_pieces
+
+OUT_LIST = get_wordlist('ENGLISH')
+
+old_to2048 = lambda n: ([] if n == 0 else old_to2048(n // 2048) + [n % 2048]) if n else []
+old_from2048 = lambda s: sum(c * (2048 ** i) for i, c in enumerate(reversed(s)))
+
+def old_checkwords(phrase):
+    size = len(phrase) + 1
+    entropy = 0
+    for w in phrase:
+        entropy = (entropy << 11) + list(OUT_LIST).index(w)
+    checksum_bits = size // 3
+    entropy_size = (size * 11 - checksum_bits) // 8
+    entropy_to_fill = 11 - checksum_bits
+    entropy_base = entropy << entropy_to_fill
+    checkwords = []
+    for i in range(0, 2 ** entropy_to_fill):
+        hash = hashlib.sha256((entropy_base | i).to_bytes(entropy_size, 'big')).digest()[0]
+        checkwords.append(OUT_LIST[(i << checksum_bits) + (hash >> (8 - checksum_bits))])
+    return checkwords
+
+def old_generate_seedphrase(language, source_input, int_value_to_add, seed_length):
+    effective_code_length = seed_length - 1
+    src_list = list(get_wordlist(language))
+    if language.upper().endswith('CHINESE') or language.upper().startswith('CHINESE'):
+        source_char_excluded, source_char_effective = '', ''
+        for s in source_input:
+            if s in src_list:
+                source_char_effective += s
+            else:
+                source_char_excluded += s
+    else:
+        source_input = source_input.lower()
+        chars_to_be_removed = '''`1234567890-=~!@#$%^&*()_+[]\\{}|;':",.<>/?'''
+        for cr in chars_to_be_removed:
+            source_input = source_input.replace(cr, ' ')
+        source_input = source_input.replace('  ', ' ').replace('  ', ' ').split(' ')
+        source_char_excluded, source_char_effective = [], []
+        for s in source_input:
+            if s in src_list:
+                source_char_effective.append(s)
+            else:
+                source_char_excluded.append(s)
+
+    source_char_excluded = set(source_char_excluded) - {''}
+    source_char_effective = (source_char_effective * effective_code_length)[:effective_code_length] if source_char_effective else [src_list[0]] * effective_code_length
+    if language.upper().endswith('CHINESE') or language.upper().startswith('CHINESE'):
+        source_char_effective = ''.join(source_char_effective)   ### chinese effective input is a str, also without wordlist characters
+    source_idxs = [src_list.index(c) for c in source_char_effective]
+    en_idxs = old_to2048(old_from2048(source_idxs) + int_value_to_add)
+    en_idxs = ([0] * effective_code_length + en_idxs)[-effective_code_length:]
+    en_output = [OUT_LIST[i] for i in en_idxs]
+    last_words = old_checkwords(en_output)
+    en_output.append(last_words[0])
+    return source_char_excluded, source_char_effective, source_idxs, en_idxs, en_output, dict(zip(range(1, len(en_output) + 1), en_output)), last_words
+
+def random_text(rnd, language):
+    src_list = get_wordlist(language)
+    if language.startswith('CHINESE'):
+        pool = rnd.choices(src_list, k=8) + list('abc 12，。！')
+        return ''.join(rnd.choices(pool, k=rnd.randrange(0, 60)))
+    pool = rnd.choices(src_list, k=8) + ['Hello', 'WORLD', 'x', '42', 'e.g.', '(1984)', '--', 'zoo;', 'it\'s']
+    separators = (' ', '  ', ', ', '!! ', ' - ', '     ')
+    return ''.join(rnd.choice(pool) + rnd.choice(separators) for _ in range(rnd.randrange(0, 40)))
+
+def random_chunks(rnd, text):
+    cuts = sorted(rnd.sample(range(len(text) + 1), min(len(text) + 1, rnd.randrange(1, 12))))
+    return [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+def test_generate_seedphrase_matches_old_implementation():
+    rnd = random.Random(0)
+    for language in LANG_DICT.values():
+        for _ in range(60):
+            text = random_text(rnd, language)
+            value = rnd.choice((0, rnd.getrandbits(256)))
+            seed_length = rnd.choice((12, 15, 18, 21, 24))
+            assert tuple(generate_seedphrase(language, text, value, seed_length)) == old_generate_seedphrase(language, text, value, seed_length), (language, text)
+
+def test_stream_matches_old_implementation():
+    rnd = random.Random(1)
+    for language in LANG_DICT.values():
+        for _ in range(60):
+            text = random_text(rnd, language)
+            value = rnd.choice((0, rnd.getrandbits(256)))
+            seed_length = rnd.choice((12, 15, 18, 21, 24))
+            stream = generate_seedphrase_stream(language, random_chunks(rnd, text), value, seed_length)
+            assert tuple(stream) == old_generate_seedphrase(language, text, value, seed_length), (language, text)
+
+def test_stream_matches_whole_text():
+    ### inputs the old tokenizer did not handle (accents in composed form, combining marks, final sigmas, full width
+    ### punctuation, any white space, case-ignorable separators between letters): the stream, cut anywhere, must still
+    ### tokenize like the whole text
+    rnd = random.Random(2)
+    extras = ['École', 'ZÈBRE', 'e\u0301cole', 'ΟΔΟΣ', 'ΟΔΟΣ.Α', 'ﬁn', '，', '（1984）', '\u3000', '\n', '\t', ' ', '  ', '...', 'İ', '',
+              'Σ', 'Σ.a', 'a.Σ', 'ー', 'ー.b', ':', "'", '\u0301', 'ǅ', '\xad']
+    for language in LANG_DICT.values():
+        src_list = get_wordlist(language)
+        for _ in range(100):
+            pool = rnd.choices(src_list, k=8) + extras
+            text = rnd.choice(('', ' ')).join(rnd.choices(pool, k=rnd.randrange(0, 60)))
+            value = rnd.choice((0, rnd.getrandbits(256)))
+            seed_length = rnd.choice((12, 15, 18, 21, 24))
+            assert tuple(generate_seedphrase_stream(language, random_chunks(rnd, text), value, seed_length)) == tuple(generate_seedphrase(language, text, value, seed_length)), (language, text)
+
+def test_stream_of_a_long_text_keeps_the_head():
+    words = list(get_wordlist('ENGLISH'))
+    text = ' '.join(words * 50)
+    chunks = (text[i:i + 4096] for i in range(0, len(text), 4096))
+    assert tuple(generate_seedphrase_stream('ENGLISH', chunks, 12345)) == old_generate_seedphrase('ENGLISH', ' '.join(words[:30]), 12345, 24)
+
+def test_stream_pieces_stay_chunk_sized():
+    ### japanese is separated by the ideographic space only, other texts by separators without any white space: the
+    ### pieces tokenized at a time must stay about one chunk long, not grow with the text
+    rnd = random.Random(3)
+    for language, separator in (('JAPANESE', '\u3000'), ('ENGLISH', ','), ('ENGLISH', '.'), ('FRENCH', "'"), ('SPANISH', ':')):
+        text = separator.join(rnd.choices(get_wordlist(language), k=50000))
+        chunks = [text[i:i + 4096] for i in range(0, len(text), 4096)]
+        pieces = list(_word_pieces(chunks))
+        assert ''.join(pieces) == text
+        assert max(map(len, pieces)) <= 4096 + 16, (language, separator)
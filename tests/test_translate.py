@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### bip39.translate: a phrase translated A -> B -> A for every pair of languages keeps its word indexes, the translation
+### is a valid phrase of B (same entropy, same checksum), and a phrase with an unknown word is not translated
+###
+###   python -m pytest tests
+
+import os
+import sys
+import json
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bip39.wordlist import LANGUAGES, get_wordlist
+from bip39.checksum import SEED_LENGTHS, checksum_idx
+from bip39.validate import phrase2idxs, validate_phrase, join_phrase
+from bip39.translate import translate_phrase, translate_phrases, main_translate
+
+def random_phrase(rnd, language):
+    idxs = [rnd.randrange(2048) for _ in range(rnd.choice(SEED_LENGTHS) - 1)]
+    idxs.append(checksum_idx(idxs))
+    return idxs, join_phrase((get_wordlist(language)[i] for i in idxs), language)
+
+def test_round_trip_every_pair():
+    rnd = random.Random(0)
+    for from_language in LANGUAGES:
+        for to_language in LANGUAGES:
+            idxs, phrase = random_phrase(rnd, from_language)
+            language, (translation,), unknown_words = translate_phrase(phrase, from_language, (to_language,))
+            assert (language, unknown_words) == (from_language, ())
+            assert phrase2idxs(translation, to_language) == (idxs, [])
+            assert validate_phrase(translation, to_language) == ('valid', to_language, (), None)
+            assert translate_phrase(translation, to_language, (from_language,)) == (to_language, [phrase], ())
+
+def test_all_targets_in_one_pass():
+    rnd = random.Random(1)
+    phrases = [random_phrase(rnd, language)[1] for language in LANGUAGES]
+    for (language, translations, _), phrase, from_language in zip(translate_phrases(phrases, 'AUTO', LANGUAGES), phrases, LANGUAGES):
+        assert translations == [translate_phrase(phrase, from_language, (to_language,))[1][0] for to_language in LANGUAGES]
+        assert phrase2idxs(translations[LANGUAGES.index(language)], language)[0] == phrase2idxs(phrase, from_language)[0]
+
+def test_unknown_words():
+    english = 'abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about'
+    assert translate_phrase(english.replace('about', 'abuot'), 'ENGLISH', ('FRENCH', 'JAPANESE')) == ('ENGLISH', None, ('abuot',))
+
+def test_file_driver(tmp_path):
+    english = 'abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about'
+    in_path, out_path = tmp_path / 'phrases.txt', tmp_path / 'out.jsonl'
+    in_path.write_text(f"{english}\n\n{english.replace('about', 'abuot')}\n", encoding='utf-8')
+    main_translate(str(in_path), str(out_path), 'ENGLISH', ('french', 'ENGLISH'))
+    records = [json.loads(line) for line in out_path.read_text(encoding='utf-8').splitlines()]
+    assert records == [{'line': 1, 'language': 'ENGLISH', 'FRENCH': translate_phrase(english, 'ENGLISH', ('FRENCH',))[1][0], 'ENGLISH': english},
+                       {'line': 3, 'language': 'ENGLISH', 'unknown_words': ['abuot']}]
+    with pytest.raises(ValueError):
+        main_translate(str(in_path), str(out_path), 'ENGLISH', ('KLINGON',))
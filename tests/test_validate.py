@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+### bip39.validate: every status for every phrase length and language, the repaired indexes, japanese / chinese
+### spacing, AUTO detection and the process pool. The phrases are built here from random entropy as the BIP39 spec
+### describes it (entropy bits + the first bits of its sha256, 11 bits per word), without bip39.checksum, and are
+### cross-checked with the mnemonic package when it is installed
+###
+###   python -m pytest tests
+
+import os
+import sys
+import random
+import hashlib
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bip39.wordlist import LANGUAGES, get_wordlist
+from bip39.validate import validate_phrase, validate_phrases, validate_phrases_parallel
+
+SEED_LENGTHS = (12, 15, 18, 21, 24)
+
+def entropy2idxs(entropy):
+    checksum_bits = len(entropy) * 8 // 32
+    bits = int.from_bytes(entropy, 'big') << checksum_bits | hashlib.sha256(entropy).digest()[0] >> (8 - checksum_bits)
+    words = (len(entropy) * 8 + checksum_bits) // 11
+    return [(bits >> (11 * (words - 1 - i))) & 2047 for i in range(words)]
+
+def phrase(idxs, language, separator=None):
+    if separator is None:
+        separator = '\u3000' if language == 'JAPANESE' else ' '
+    return separator.join(get_wordlist(language)[i] for i in idxs)
+
+def random_idxs(rnd, words):
+    return entropy2idxs(rnd.getrandbits(words * 32 // 3).to_bytes(words * 4 // 3, 'big'))
+
+def test_valid():
+    rnd = random.Random(0)
+    for language in LANGUAGES:
+        for words in SEED_LENGTHS:
+            for _ in range(5):
+                assert validate_phrase(phrase(random_idxs(rnd, words), language), language) == ('valid', language, (), None)
+
+def test_bad_checksum_and_repair():
+    rnd = random.Random(1)
+    for language in LANGUAGES:
+        for words in SEED_LENGTHS:
+            idxs = random_idxs(rnd, words)
+            ### a checksum bit flipped in the last word: the repair gives the phrase back
+            wrong = idxs[:-1] + [idxs[-1] ^ 1]
+            assert validate_phrase(phrase(wrong, language), language) == ('bad_checksum', language, (), None)
+            assert validate_phrase(phrase(wrong, language), language, repair=True) == ('bad_checksum', language, (), tuple(idxs))
+            ### another word changed: the repair keeps every word and the entropy bits of the last one
+            changed = list(idxs)
+            changed[rnd.randrange(words - 1)] ^= 1 << rnd.randrange(11)
+            status, _, _, repaired = validate_phrase(phrase(changed, language), language, repair=True)
+            if status == 'bad_checksum':
+                checksum_bits = words // 3
+                assert repaired[:-1] == tuple(changed[:-1])
+                assert repaired[-1] >> checksum_bits == changed[-1] >> checksum_bits
+                assert validate_phrase(phrase(repaired, language), language) == ('valid', language, (), None)
+            else:
+                assert status == 'valid'   ### 1 in 2**checksum_bits: the checksum still matches
+
+def test_unknown_words():
+    rnd = random.Random(2)
+    for language in LANGUAGES:
+        for words in SEED_LENGTHS:
+            unknown = 'Ω' if language.startswith('CHINESE') else 'xyzzy'   ### a chinese phrase is split into characters
+            words_of_phrase = phrase(random_idxs(rnd, words), language).split()
+            words_of_phrase[rnd.randrange(words)] = unknown
+            assert validate_phrase(' '.join(words_of_phrase), language, repair=True) == ('unknown_words', language, (unknown,), None)
+
+def test_bad_length():
+    rnd = random.Random(3)
+    for language in LANGUAGES:
+        for words in SEED_LENGTHS:
+            idxs = random_idxs(rnd, words)
+            assert validate_phrase(phrase(idxs[:-1], language), language, repair=True) == ('bad_length', language, (), None)
+            assert validate_phrase(phrase(idxs + idxs[:1], language), language, repair=True) == ('bad_length', language, (), None)
+    assert validate_phrase('', 'ENGLISH') == ('bad_length', 'ENGLISH', (), None)
+
+def test_japanese_and_chinese_spacing():
+    rnd = random.Random(4)
+    for words in SEED_LENGTHS:
+        idxs = random_idxs(rnd, words)
+        for separator in ('\u3000', ' ', ' \u3000\n'):
+            assert validate_phrase(phrase(idxs, 'JAPANESE', separator), 'JAPANESE')[0] == 'valid'
+        for language in ('CHINESE_SIMPLIFIED', 'CHINESE_TRADITIONAL'):
+            for separator in ('', ' ', '\u3000'):
+                assert validate_phrase(phrase(idxs, language, separator), language)[0] == 'valid'
+
+def test_auto():
+    rnd = random.Random(5)
+    for language in LANGUAGES:
+        for words in SEED_LENGTHS:
+            idxs = random_idxs(rnd, words)
+            text = phrase(idxs, language)
+            status, detected, _, _ = validate_phrase(text, 'AUTO')
+            ### the first language knowing every word - chinese simplified and traditional share many characters
+            expected = next(lang for lang in LANGUAGES if all(w in get_wordlist(lang) for w in text.split()))
+            assert (status, detected) == ('valid', expected)
+    english = 'abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about'
+    assert validate_phrase(english, 'AUTO') == ('valid', 'ENGLISH', (), None)
+    assert validate_phrase(english.replace('about', 'abuot'), 'auto') == ('unknown_words', 'ENGLISH', ('abuot',), None)
+
+def test_parallel_same_order():
+    rnd = random.Random(6)
+    phrases = []
+    for n in range(300):
+        language = rnd.choice(LANGUAGES)
+        idxs = random_idxs(rnd, rnd.choice(SEED_LENGTHS))
+        idxs[-1] ^= n % 2   ### every other phrase with a bad checksum
+        phrases.append(phrase(idxs[:-1] if n % 7 == 0 else idxs, language))
+    for language in ('AUTO', 'ENGLISH'):
+        serial = list(validate_phrases(phrases, language, True))
+        assert list(validate_phrases_parallel(phrases, language, True, processes=2, chunksize=7)) == serial
+
+def test_mnemonic_package_agrees():
+    mnemonic = pytest.importorskip('mnemonic')
+    rnd = random.Random(7)
+    for language in LANGUAGES:
+        m = mnemonic.Mnemonic(language.lower())
+        for words in SEED_LENGTHS:
+            entropy = rnd.getrandbits(words * 32 // 3).to_bytes(words * 4 // 3, 'big')
+            text = m.to_mnemonic(entropy)
+            assert text == phrase(entropy2idxs(entropy), language)
+            assert validate_phrase(text, language)[0] == 'valid'
+            wrong = phrase(entropy2idxs(entropy)[:-1] + [entropy2idxs(entropy)[-1] ^ 1], language)
+            assert validate_phrase(wrong, language)[0] == 'bad_checksum' and not m.check(wrong)